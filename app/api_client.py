@@ -1,25 +1,50 @@
+import time
+import threading
 import requests
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 from app.config import Config
 
 
 class CoreLogicAPIClient:
     def __init__(self):
-        self.config = Config()
+        self.config = Config  # Class attributes are read once at import
         self.access_token = None
+        self._token_expiry = 0.0
+        # One client is shared by the lookup threads; only one of them re-authenticates
+        self._token_lock = threading.Lock()
+
+        # Reuse TCP/TLS connections across property lookups
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
 
     def authenticate(self) -> bool:
         """Get access token from CoreLogic API"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.config.ACCESS_TOKEN_URL,
                 data={},
                 auth=HTTPBasicAuth(self.config.CLIENT_ID, self.config.CLIENT_SECRET)
             )
 
             if response.status_code == 200:
-                self.access_token = response.json()["access_token"]
+                token_data = response.json()
+                self.access_token = token_data["access_token"]
+                # Refresh slightly before the token actually expires
+                expires_in = int(token_data.get("expires_in", 3600))
+                self._token_expiry = time.monotonic() + expires_in - 30
+                self.session.headers.update(self._get_headers())
                 print(f"Authentication successful")
                 return True
             else:
@@ -29,6 +54,19 @@ class CoreLogicAPIClient:
             print(f"Authentication error: {str(e)}")
             return False
 
+    def _token_valid(self) -> bool:
+        return bool(self.access_token) and time.monotonic() < self._token_expiry
+
+    def ensure_token(self) -> bool:
+        """Re-authenticate only when there is no token or it has expired"""
+        if self._token_valid():
+            return True
+        with self._token_lock:
+            # Another thread may have refreshed it while this one waited
+            if self._token_valid():
+                return True
+            return self.authenticate()
+
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with authentication"""
         return {
@@ -40,6 +78,9 @@ class CoreLogicAPIClient:
 
     def search_property(self, address: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """Search for property by address"""
+        if not self.ensure_token():
+            return None
+
         url = f"{self.config.PROPERTY_API_BASE_URL}/properties/search"
         params = {
             'streetAddress': address['street'],
@@ -50,7 +91,7 @@ class CoreLogicAPIClient:
         }
 
         try:
-            response = requests.get(url, headers=self._get_headers(), params=params)
+            response = self.session.get(url, params=params)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -62,10 +103,13 @@ class CoreLogicAPIClient:
 
     def get_property_details(self, clip: str) -> Optional[Dict[str, Any]]:
         """Get detailed property information by CLIP"""
+        if not self.ensure_token():
+            return None
+
         url = f"{self.config.PROPERTY_API_BASE_URL}/properties/{clip}/property-detail"
 
         try:
-            response = requests.get(url, headers=self._get_headers())
+            response = self.session.get(url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -73,4 +117,10 @@ class CoreLogicAPIClient:
                 return None
         except Exception as e:
             print(f"Property details error: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+
+@lru_cache(maxsize=1)
+def get_corelogic_client() -> CoreLogicAPIClient:
+    """Shared CoreLogic client: the access token and pooled connections are reused across requests"""
+    return CoreLogicAPIClient()
@@ -0,0 +1,373 @@
+import time
+import asyncio
+import secrets
+import functools
+import orjson
+from collections import Counter
+from typing import Dict, Any, Optional, List, Tuple
+from cachetools import TLRUCache, TTLCache
+import numpy as np
+import redis.asyncio as redis
+from app.config import Config
+
+
+# Delete the lock only if it still holds our token: a holder that outlived the
+# TTL must not remove a lock another request has taken since
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+BULK_BATCH_SIZE = 500  # Keys per MGET / pipeline in the bulk calls
+STATS_SCAN_ROUNDS = 10  # SCAN calls per stats request; past that the count is a lower bound
+
+
+def _cache_miss_on_error(fallback=lambda: None):
+    """Treat a failed Redis call as a cache miss: log it and return fallback()"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except (redis.RedisError, OSError) as e:
+                print(f"[WARNING] Redis {func.__name__} failed ({e}), treating it as a cache miss")
+                return fallback()
+        return wrapper
+    return decorator
+
+
+class InMemoryCacheService:
+    """Process-local cache used when Redis is not configured or unreachable"""
+
+    backend = "memory"
+
+    def __init__(self):
+        # Bounded LRU with per-entry expiry: expired entries are dropped lazily,
+        # and the least recently used ones are evicted once LOCAL_CACHE_MAX is reached
+        self._store = TLRUCache(
+            maxsize=Config.LOCAL_CACHE_MAX,
+            ttu=lambda key, entry, now: entry[0],
+            timer=time.monotonic
+        )
+        self._locks: Dict[str, Tuple[float, str]] = {}
+        self._scores: Dict[str, Counter] = {}
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._store.get(key)
+        return entry[1] if entry is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int):
+        self._store[key] = (time.monotonic() + ttl, value)
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        return await self.get(key)
+
+    async def get_with_raw(self, key: str, raw_key: str) -> Tuple[Optional[Any], Optional[bytes]]:
+        return await self.get(key), await self.get_raw(raw_key)
+
+    async def set_raw(self, key: str, value: bytes, ttl: int):
+        await self.set(key, value, ttl)
+
+    # Bulk-indexing embeddings are not kept in process: thousands of them
+    # would evict the search results sharing this LRU
+
+    async def get_many_raw(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [None] * len(keys)
+
+    async def set_many_raw(self, items: Dict[str, bytes], ttl: int):
+        pass
+
+    async def acquire_lock(self, key: str, ttl: int) -> Optional[str]:
+        now = time.time()
+        held = self._locks.get(key)
+        if held and held[0] > now:
+            return None
+        token = secrets.token_hex(8)
+        self._locks[key] = (now + ttl, token)
+        return token
+
+    async def release_lock(self, key: str, token: str):
+        held = self._locks.get(key)
+        if held and held[1] == token:
+            del self._locks[key]
+
+    async def clear(self, prefix: str) -> int:
+        keys = [k for k in self._store if k.startswith(prefix)]
+        for k in keys:
+            del self._store[k]
+        return len(keys)
+
+    async def increment_score(self, key: str, member: str, amount: float = 1):
+        counter = self._scores.setdefault(key, Counter())
+        counter[member] += amount
+        # Keep the counter bounded: drop the long tail of one-off members
+        if len(counter) > Config.CACHE_QUERY_STATS_MAX * 2:
+            self._scores[key] = Counter(dict(counter.most_common(Config.CACHE_QUERY_STATS_MAX)))
+
+    async def top_scored(self, key: str, count: int) -> List[Tuple[str, float]]:
+        return self._scores.get(key, Counter()).most_common(count)
+
+    async def entries(self, prefix: str, limit: int = 5) -> Dict[str, Any]:
+        """Count entries under prefix and return the remaining TTL of a few of them"""
+        self._store.expire()
+        keys = [k for k in self._store if k.startswith(prefix)]
+        now = time.monotonic()
+        return {
+            'count': len(keys),
+            'complete': True,
+            'sample': [(k, self._store[k][0] - now) for k in keys[:limit]]
+        }
+
+
+class RedisCacheService:
+    """Redis-backed cache shared by all workers"""
+
+    backend = "redis"
+
+    def __init__(self, client: redis.Redis):
+        self.redis_client = client
+        # Raw values (query embeddings) never change for a given key, so hot
+        # ones are also kept in process to skip the network round trip
+        self._local_raw = TTLCache(maxsize=Config.CACHE_L1_MAX, ttl=Config.CACHE_L1_TTL)
+        self._release_lock_script = client.register_script(RELEASE_LOCK_SCRIPT)
+
+    # Search-path calls degrade to a miss when Redis hiccups, so the request
+    # still runs against OpenSearch instead of failing
+
+    @_cache_miss_on_error(bool)
+    async def ping(self) -> bool:
+        return bool(await self.redis_client.ping())
+
+    @_cache_miss_on_error()
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.redis_client.get(key)
+        return orjson.loads(raw) if raw is not None else None
+
+    @_cache_miss_on_error()
+    async def set(self, key: str, value: Any, ttl: int):
+        await self.redis_client.setex(key, ttl, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+
+    @_cache_miss_on_error()
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        value = self._local_raw.get(key)
+        if value is None:
+            value = await self.redis_client.get(key)
+            if value is not None:
+                self._local_raw[key] = value
+        return value
+
+    @_cache_miss_on_error(lambda: (None, None))
+    async def get_with_raw(self, key: str, raw_key: str) -> Tuple[Optional[Any], Optional[bytes]]:
+        """get(key) and get_raw(raw_key) in one round trip (a single MGET)"""
+        raw_value = self._local_raw.get(raw_key)
+        if raw_value is not None:
+            return await self.get(key), raw_value
+
+        value, raw_value = await self.redis_client.mget([key, raw_key])
+        if raw_value is not None:
+            self._local_raw[raw_key] = raw_value
+        return (orjson.loads(value) if value is not None else None), raw_value
+
+    @_cache_miss_on_error()
+    async def set_raw(self, key: str, value: bytes, ttl: int):
+        self._local_raw[key] = value
+        await self.redis_client.setex(key, ttl, value)
+
+    # Bulk variants for indexing: one MGET / one pipeline per batch instead of
+    # a command (and a pooled connection) per key, and no in-process copy
+
+    @_cache_miss_on_error()
+    async def get_many_raw(self, keys: List[str]) -> List[Optional[bytes]]:
+        values: List[Optional[bytes]] = []
+        for start in range(0, len(keys), BULK_BATCH_SIZE):
+            values.extend(await self.redis_client.mget(keys[start:start + BULK_BATCH_SIZE]))
+        return values
+
+    @_cache_miss_on_error()
+    async def set_many_raw(self, items: Dict[str, bytes], ttl: int):
+        entries = list(items.items())
+        for start in range(0, len(entries), BULK_BATCH_SIZE):
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in entries[start:start + BULK_BATCH_SIZE]:
+                    pipe.setex(key, ttl, value)
+                await pipe.execute()
+
+    async def acquire_lock(self, key: str, ttl: int) -> Optional[str]:
+        """Token of the acquired lock, or None when another request holds it"""
+        token = secrets.token_hex(8)
+        try:
+            return token if await self.redis_client.set(key, token, nx=True, ex=ttl) else None
+        except (redis.RedisError, OSError) as e:
+            # Nobody can hold the lock either; run the search rather than wait
+            print(f"[WARNING] Redis acquire_lock failed ({e}), continuing without the lock")
+            return token
+
+    @_cache_miss_on_error()
+    async def release_lock(self, key: str, token: str):
+        await self._release_lock_script(keys=[key], args=[token])
+
+    @_cache_miss_on_error()
+    async def increment_score(self, key: str, member: str, amount: float = 1):
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.zincrby(key, amount, member)
+            pipe.zcard(key)
+            _, size = await pipe.execute()
+        # Same bound as the in-process counter: past twice the limit, drop the
+        # lowest-scored members (the long tail of one-off queries)
+        if size > Config.CACHE_QUERY_STATS_MAX * 2:
+            await self.redis_client.zremrangebyrank(key, 0, size - Config.CACHE_QUERY_STATS_MAX - 1)
+
+    @_cache_miss_on_error(list)
+    async def top_scored(self, key: str, count: int) -> List[Tuple[str, float]]:
+        members = await self.redis_client.zrevrange(key, 0, count - 1, withscores=True)
+        return [(member.decode(), score) for member, score in members]
+
+    @_cache_miss_on_error(int)
+    async def clear(self, prefix: str) -> int:
+        for key in [k for k in self._local_raw if k.startswith(prefix)]:
+            del self._local_raw[key]
+
+        # SCAN instead of KEYS so Redis keeps serving other clients, and
+        # UNLINK so the values are freed in the background
+        count = 0
+        batch: List[bytes] = []
+        async for key in self.redis_client.scan_iter(match=f"{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                count += await self.redis_client.unlink(*batch)
+                batch = []
+        if batch:
+            count += await self.redis_client.unlink(*batch)
+        return count
+
+    @_cache_miss_on_error(lambda: {'count': 0, 'complete': False, 'sample': []})
+    async def entries(self, prefix: str, limit: int = 5) -> Dict[str, Any]:
+        """
+        Count entries under prefix and return the remaining TTL of a few of them.
+        At most STATS_SCAN_ROUNDS SCAN calls are made, so the cost doesn't grow
+        with the keyspace; 'complete' is False when the count stopped early.
+        """
+        count = 0
+        keys: List[bytes] = []
+        cursor = 0
+        for _ in range(STATS_SCAN_ROUNDS):
+            cursor, batch = await self.redis_client.scan(cursor, match=f"{prefix}*", count=500)
+            count += len(batch)
+            keys.extend(batch[:limit - len(keys)])
+            if cursor == 0:
+                break
+
+        ttls = []
+        if keys:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.ttl(key)
+                ttls = await pipe.execute()
+        return {
+            'count': count,
+            'complete': cursor == 0,
+            'sample': [(key.decode(), ttl) for key, ttl in zip(keys, ttls)]
+        }
+
+
+class SimilarQueryIndex:
+    """
+    Ring buffer of recent query embeddings, used to find a cached response
+    for a near-duplicate query (same filters, nearly identical meaning).
+    """
+
+    def __init__(self, capacity: int, dimension: int):
+        self._vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        self._entries: List[Optional[Tuple[str, str]]] = [None] * capacity
+        self._next = 0
+        self._size = 0
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        return v / norm if norm > 0 else v
+
+    def add(self, vector: np.ndarray, signature: str, cache_key: str):
+        """Remember a cached query; the oldest entry is overwritten when full"""
+        slot = self._next
+        self._vectors[slot] = self._normalize(vector)
+        self._entries[slot] = (signature, cache_key)
+        self._next = (slot + 1) % len(self._entries)
+        self._size = min(self._size + 1, len(self._entries))
+
+    def find(self, vector: np.ndarray, signature: str, threshold: float) -> Optional[str]:
+        """Cache key of the most similar query with the same signature, if any"""
+        if not self._size:
+            return None
+
+        # Rows are unit vectors, so the dot product is the cosine similarity
+        sims = self._vectors[:self._size] @ self._normalize(vector)
+        candidates = np.flatnonzero(sims >= threshold)
+        for i in candidates[np.argsort(sims[candidates])[::-1]]:
+            entry_signature, cache_key = self._entries[i]
+            if entry_signature == signature:
+                return cache_key
+        return None
+
+
+_cache_service = None
+_cache_service_lock = asyncio.Lock()
+
+
+async def get_cache_service():
+    """
+    Get the shared cache service.
+    Uses Redis when REDIS_HOST is set and reachable, otherwise an in-process cache.
+    """
+    global _cache_service
+    if _cache_service is not None:
+        return _cache_service
+
+    # Requests arriving before the first ping finishes must not each build a client
+    async with _cache_service_lock:
+        if _cache_service is None:
+            _cache_service = await _create_cache_service()
+    return _cache_service
+
+
+async def _create_cache_service():
+    """Connect to Redis if configured, falling back to the in-process cache"""
+    if Config.REDIS_HOST:
+        # Blocking pool: at REDIS_MAX_CONNECTIONS, callers wait up to
+        # REDIS_POOL_TIMEOUT for a free connection instead of failing at once
+        pool = redis.BlockingConnectionPool(
+            host=Config.REDIS_HOST,
+            port=Config.REDIS_PORT,
+            db=Config.REDIS_DB,
+            password=Config.REDIS_PASSWORD,
+            max_connections=Config.REDIS_MAX_CONNECTIONS,
+            timeout=Config.REDIS_POOL_TIMEOUT,
+            # Pooled connections can sit idle for a while; detect dead ones
+            # before use instead of failing the request that picks them up
+            socket_keepalive=True,
+            health_check_interval=30
+        )
+        client = redis.Redis.from_pool(pool)
+        try:
+            await client.ping()
+            print(f"Using Redis cache at {Config.REDIS_HOST}:{Config.REDIS_PORT}")
+            return RedisCacheService(client)
+        except (redis.ConnectionError, redis.TimeoutError, OSError) as e:
+            print(f"[WARNING] Redis unavailable ({e}), using in-process cache")
+            await client.aclose()
+
+    return InMemoryCacheService()
+
+
+async def close_cache_service():
+    """Close the Redis connection pool, if any"""
+    global _cache_service
+    if isinstance(_cache_service, RedisCacheService):
+        await _cache_service.redis_client.aclose()
+    _cache_service = None
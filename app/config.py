@@ -12,12 +12,38 @@ class Config:
     COOKIE = os.getenv("COOKIE")
     DEVELOPER_EMAIL = os.getenv("DEVELOPER_EMAIL")
     PROPERTY_API_BASE_URL = "https://property.corelogicapi.com/v2"
+    CORELOGIC_CONCURRENCY = int(os.getenv("CORELOGIC_CONCURRENCY", "8"))  # Parallel lookups per level (addresses, details)
 
     # OpenSearch
     OPENSEARCH_HOST = os.getenv("OPENSEARCH_HOST", "localhost")
     OPENSEARCH_PORT = int(os.getenv("OPENSEARCH_PORT", "9200"))
     OPENSEARCH_USER = os.getenv("OPENSEARCH_USER", "admin")
     OPENSEARCH_PASSWORD = os.getenv("OPENSEARCH_PASSWORD", "Ibr@#25085#@")
+    OPENSEARCH_POOL_MAXSIZE = int(os.getenv("OPENSEARCH_POOL_MAXSIZE", "32"))  # Connections kept per client
+    OPENSEARCH_HTTP_COMPRESS = os.getenv("OPENSEARCH_HTTP_COMPRESS", "true").lower() == "true"  # gzip bodies
+
+    # Redis (leave REDIS_HOST empty to use the in-process cache)
+    REDIS_HOST = os.getenv("REDIS_HOST", "")
+    REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+    REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+    REDIS_PASSWORD = os.getenv("REDIS_PASSWORD") or None
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "1"))  # Seconds to wait for a free pooled connection
+
+    # Caching
+    LOCAL_CACHE_MAX = int(os.getenv("LOCAL_CACHE_MAX", "1000"))  # Max entries in the in-process cache
+    CACHE_L1_MAX = int(os.getenv("CACHE_L1_MAX", "10000"))  # Embeddings kept in process in front of Redis
+    CACHE_L1_TTL = int(os.getenv("CACHE_L1_TTL", "600"))  # Seconds before an in-process copy is re-read
+    CACHE_QUERY_RESULTS_TTL = int(os.getenv("CACHE_QUERY_RESULTS_TTL", "300"))  # 5 minutes
+    CACHE_LOCK_TTL = int(os.getenv("CACHE_LOCK_TTL", "5"))  # Stampede lock expiry
+    CACHE_EMBEDDING_TTL = int(os.getenv("CACHE_EMBEDDING_TTL", "86400"))  # 24 hours
+    CACHE_PREFETCH_NEXT_PAGE = os.getenv("CACHE_PREFETCH_NEXT_PAGE", "true").lower() == "true"
+    CACHE_SIMILARITY_THRESHOLD = float(os.getenv("CACHE_SIMILARITY_THRESHOLD", "0.98"))  # Near-duplicate query reuse
+    CACHE_SIMILARITY_SIZE = int(os.getenv("CACHE_SIMILARITY_SIZE", "1024"))  # Recent query embeddings kept
+    CACHE_WARMING_ENABLED = os.getenv("CACHE_WARMING_ENABLED", "true").lower() == "true"
+    CACHE_WARMING_INTERVAL = int(os.getenv("CACHE_WARMING_INTERVAL", "240"))  # Keep below the results TTL
+    CACHE_WARMING_TOP_K = int(os.getenv("CACHE_WARMING_TOP_K", "100"))  # Most frequent queries to pre-run
+    CACHE_QUERY_STATS_MAX = int(os.getenv("CACHE_QUERY_STATS_MAX", "1000"))  # Distinct queries counted for warming
 
     # OpenAI
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -27,8 +53,19 @@ class Config:
     LM_STUDIO_ENDPOINT = os.getenv("LM_STUDIO_ENDPOINT", "http://172.30.160.1:1234/v1")
     LM_STUDIO_API_KEY = os.getenv("LM_STUDIO_API_KEY", "lm-studio")
     LM_STUDIO_EMBEDDING_MODEL = os.getenv("LM_STUDIO_EMBEDDING_MODEL", "text-embedding-nomic-embed-text-v1.5")
+    EMBEDDING_TIMEOUT = float(os.getenv("EMBEDDING_TIMEOUT", "30"))  # Seconds per embedding request
+    EMBEDDING_CONNECT_TIMEOUT = float(os.getenv("EMBEDDING_CONNECT_TIMEOUT", "2"))
+    EMBEDDING_QUERY_TIMEOUT = float(os.getenv("EMBEDDING_QUERY_TIMEOUT", "5"))  # Search path (has keyword fallback)
 
     # Index Configuration
     INDEX_NAME = "corelogic_properties_vector"
     # EMBEDDING_DIMENSION = 1536 ## For Open AI API
-    EMBEDDING_DIMENSION = 768 ## For LM Studio API
\ No newline at end of file
+    EMBEDDING_DIMENSION = 768 ## For LM Studio API
+    MAX_DESCRIPTION_CHARS = int(os.getenv("MAX_DESCRIPTION_CHARS", "512"))  # Embedded description budget
+    VECTOR_QUANTIZATION_SCALE = float(os.getenv("VECTOR_QUANTIZATION_SCALE", "0"))  # int8 scale for unit vectors; 0 = estimate from the dimension
+    KNN_ENGINE = os.getenv("KNN_ENGINE", "lucene")  # "lucene", or "faiss" (SIMD distance kernels, OpenSearch 2.17+ for byte vectors)
+
+    # Bulk indexing
+    BULK_INDEX_BATCH_SIZE = int(os.getenv("BULK_INDEX_BATCH_SIZE", "64"))  # Texts per embedding request
+    BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "500"))  # Documents per bulk API request
+    EMBED_CONCURRENCY = int(os.getenv("EMBED_CONCURRENCY", "8"))  # Parallel embedding requests (async indexing)
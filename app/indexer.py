@@ -1,7 +1,12 @@
-from openai import OpenAI
-from typing import List, Dict, Optional
+from openai import OpenAI, AsyncOpenAI, Timeout
+from opensearchpy import helpers
+from typing import List, Dict, Optional, Tuple, Union
 from app.config import Config
-from app.opensearch_client import get_opensearch_client
+from app.cache import get_cache_service
+from app.opensearch_client import get_opensearch_client, get_async_opensearch_client
+import numpy as np
+import asyncio
+import hashlib
 import time
 
 # # For Open AI API
@@ -10,10 +15,53 @@ import time
 
 # Point to your local LM Studio server
 embedding_model = Config.LM_STUDIO_EMBEDDING_MODEL
+# Fail fast when the server is down instead of waiting out the default 10 minute timeout
+embedding_timeout = Timeout(Config.EMBEDDING_TIMEOUT, connect=Config.EMBEDDING_CONNECT_TIMEOUT)
 openai_client = OpenAI(
     base_url=Config.LM_STUDIO_ENDPOINT,
-    api_key=Config.LM_STUDIO_API_KEY  # LM Studio doesn't require a real key, but the client needs something
+    api_key=Config.LM_STUDIO_API_KEY,  # LM Studio doesn't require a real key, but the client needs something
+    timeout=embedding_timeout
 )
+# Async client for the search path, so embedding calls don't block the event loop
+async_openai_client = AsyncOpenAI(
+    base_url=Config.LM_STUDIO_ENDPOINT,
+    api_key=Config.LM_STUDIO_API_KEY,
+    timeout=embedding_timeout
+)
+# Search queries fall back to keyword search, so they get no retries and a short deadline
+# (same connection pool as async_openai_client)
+query_openai_client = async_openai_client.with_options(
+    max_retries=0,
+    timeout=Timeout(Config.EMBEDDING_QUERY_TIMEOUT, connect=Config.EMBEDDING_CONNECT_TIMEOUT)
+)
+# Bulk API request shape: documents per request, request size cap and timeout
+BULK_REQUEST_OPTIONS = {
+    "chunk_size": Config.BULK_CHUNK_SIZE,
+    "max_chunk_bytes": 10 * 1024 * 1024,
+    "request_timeout": 60
+}
+# Caps in-flight embedding requests; a local LM Studio slows down with many parallel calls
+_embedding_semaphore = asyncio.Semaphore(Config.EMBED_CONCURRENCY)
+# Query embeddings currently being generated, so concurrent misses share one model call
+_inflight_embeddings: Dict[str, asyncio.Task] = {}
+# int8 scale shared by documents and queries, so inner-product ranking stays
+# consistent. Unit-vector components are only ~1/sqrt(dim) in size; the
+# default maps the ~p99.9 magnitude (about 3.3/sqrt(dim)) to 127
+QUANTIZATION_SCALE = Config.VECTOR_QUANTIZATION_SCALE or 127 * np.sqrt(Config.EMBEDDING_DIMENSION) / 3.3
+
+
+def _validate_embedding(embedding: Optional[List[float]]) -> Optional[List[float]]:
+    """Return the embedding if it is usable for the index, otherwise None"""
+    if not embedding or len(embedding) == 0:
+        print(f"[ERROR] Empty embedding returned")
+        return None
+
+    if len(embedding) != Config.EMBEDDING_DIMENSION:
+        print(f"[ERROR] Embedding dimension mismatch: expected {Config.EMBEDDING_DIMENSION}, got {len(embedding)}")
+        return None
+
+    return embedding
+
 
 def generate_embedding(text: str) -> Optional[List[float]]:
     if not text or not text.strip():
@@ -25,100 +73,287 @@ def generate_embedding(text: str) -> Optional[List[float]]:
             model=embedding_model,
             input=text
         )
-        embedding = response.data[0].embedding
-        # Validate embedding
-        if not embedding or len(embedding) == 0:
-            print(f"[ERROR] Empty embedding returned")
-            return None
+        return _validate_embedding(response.data[0].embedding)
+    except Exception as e:
+        print(f"Embedding generation failed: {e}")
+        return None
 
-        if len(embedding) != Config.EMBEDDING_DIMENSION:
-            print(f"[ERROR] Embedding dimension mismatch: expected {Config.EMBEDDING_DIMENSION}, got {len(embedding)}")
-            return None
 
-        return embedding
+def generate_embeddings(texts: List[str]) -> List[Optional[List[float]]]:
+    """
+    Generate embeddings for many texts, sending up to
+    Config.BULK_INDEX_BATCH_SIZE inputs per embedding request.
+    A failed batch falls back to one request per text.
+    Returns one entry per input text (None where embedding failed).
+    """
+    embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+    # Empty texts are skipped and keep a None placeholder
+    pending = [i for i, text in enumerate(texts) if text and text.strip()]
+    batch_size = max(1, Config.BULK_INDEX_BATCH_SIZE)
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        try:
+            response = openai_client.embeddings.create(
+                model=embedding_model,
+                input=[texts[i] for i in batch]
+            )
+            # Results are matched to inputs by index, not by response order
+            for item in sorted(response.data, key=lambda d: d.index):
+                embeddings[batch[item.index]] = _validate_embedding(item.embedding)
+        except Exception as e:
+            # One bad input (or an overloaded server) shouldn't drop the whole slice
+            print(f"Batch embedding generation failed ({len(batch)} texts), retrying one by one: {e}")
+            for i in batch:
+                embeddings[i] = generate_embedding(texts[i])
+
+    return embeddings
+
+
+async def generate_embeddings_async(texts: List[str]) -> List[Optional[List[float]]]:
+    """
+    Async variant of generate_embeddings: cached embeddings are reused and
+    the remaining batches are sent concurrently, at most Config.EMBED_CONCURRENCY at a time.
+    """
+    embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+    pending = [i for i, text in enumerate(texts) if text and text.strip()]
+    batch_size = max(1, Config.BULK_INDEX_BATCH_SIZE)
+
+    # Re-indexing unchanged properties reuses their cached embeddings
+    cache = await get_cache_service()
+    cache_keys = {i: get_embedding_cache_key(texts[i]) for i in pending}
+    cached = await cache.get_many_raw([cache_keys[i] for i in pending]) or [None] * len(pending)
+    for i, raw in zip(pending, cached):
+        if raw:
+            embeddings[i] = decode_embedding(raw)
+    pending = [i for i in pending if embeddings[i] is None]
+
+    async def embed_batch(batch: List[int]):
+        async with _embedding_semaphore:
+            try:
+                response = await async_openai_client.embeddings.create(
+                    model=embedding_model,
+                    input=[texts[i] for i in batch]
+                )
+                for item in sorted(response.data, key=lambda d: d.index):
+                    embeddings[batch[item.index]] = _validate_embedding(item.embedding)
+                return
+            except Exception as e:
+                print(f"Batch embedding generation failed ({len(batch)} texts), retrying one by one: {e}")
+
+            for i in batch:
+                try:
+                    response = await async_openai_client.embeddings.create(
+                        model=embedding_model,
+                        input=texts[i]
+                    )
+                    embeddings[i] = _validate_embedding(response.data[0].embedding)
+                except Exception as e:
+                    print(f"Embedding generation failed: {e}")
+
+    await asyncio.gather(*(
+        embed_batch(pending[start:start + batch_size])
+        for start in range(0, len(pending), batch_size)
+    ))
+
+    await cache.set_many_raw({
+        cache_keys[i]: encode_embedding(embeddings[i])
+        for i in pending if embeddings[i] is not None
+    }, Config.CACHE_EMBEDDING_TTL)
+    return embeddings
+
+
+def normalize_embedding(embedding: List[float]) -> np.ndarray:
+    """L2-normalize an embedding into a float32 array (cosine becomes a dot product)"""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def quantize_embedding(embedding: List[float]) -> np.ndarray:
+    """
+    L2-normalize an embedding and scale it to int8 for the byte knn_vector field.
+    Every stored and query vector then has the same norm, so the index can rank
+    by raw inner product instead of re-normalizing per comparison (cosine).
+    Components past the QUANTIZATION_SCALE range are clipped to +-127.
+    The array is serialized as-is by OrjsonSerializer (no Python list in between).
+    """
+    vector = normalize_embedding(embedding)
+    return np.clip(np.round(vector * QUANTIZATION_SCALE), -127, 127).astype(np.int8)
+
+
+def check_quantization_scale(embeddings: List[Optional[List[float]]]):
+    """Warn when the corpus calls for a very different int8 scale than QUANTIZATION_SCALE"""
+    vectors = [normalize_embedding(e) for e in embeddings if e is not None]
+    if not vectors:
+        return
+
+    calibrated = 127 / float(np.quantile(np.abs(np.stack(vectors)), 0.999))
+    if abs(calibrated / QUANTIZATION_SCALE - 1) > 0.25:
+        print(f"[WARNING] int8 scale {QUANTIZATION_SCALE:.0f} doesn't fit these embeddings "
+              f"(p99.9 of the components calls for {calibrated:.0f}); "
+              f"set VECTOR_QUANTIZATION_SCALE={calibrated:.0f} and rebuild the index")
+
+
+def get_embedding_cache_key(text: str) -> str:
+    """Cache key for a text embedding, scoped to the embedding model and the cache encoding"""
+    digest = hashlib.sha1(text.strip().lower().encode()).hexdigest()
+    return f"emb:i8:{embedding_model}:{digest}"
+
+
+def encode_embedding(embedding: List[float]) -> bytes:
+    """Pack an embedding for the cache: float32 scale followed by int8 components"""
+    vector = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.abs(vector).max()) / 127.0 or 1.0
+    quantized = np.clip(np.round(vector / scale), -127, 127).astype(np.int8)
+    return np.float32(scale).tobytes() + quantized.tobytes()
+
+
+def decode_embedding(raw: bytes) -> np.ndarray:
+    """Unpack a cached int8 embedding back to float32"""
+    scale = np.frombuffer(raw, dtype=np.float32, count=1)[0]
+    return np.frombuffer(raw, dtype=np.int8, offset=4).astype(np.float32) * scale
+
+
+async def generate_embedding_async(text: str, skip_cache_probe: bool = False) -> Optional[np.ndarray]:
+    """
+    Async variant of generate_embedding used by the search endpoints.
+    Returns an L2-normalized float32 vector, cached as int8 bytes so
+    repeated queries skip the model call.
+    """
+    if not text or not text.strip():
+        print(f"[SKIP] Empty text provided for embedding")
+        return None
+
+    try:
+        cache = await get_cache_service()
+        cache_key = get_embedding_cache_key(text)
+
+        # Callers that already probed the cache (hybrid_search) skip the second read
+        if not skip_cache_probe:
+            cached = await cache.get_raw(cache_key)
+            if cached:
+                return decode_embedding(cached)
+
+        task = _inflight_embeddings.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(_embed_query(text, cache_key, cache))
+            _inflight_embeddings[cache_key] = task
+            task.add_done_callback(lambda _: _inflight_embeddings.pop(cache_key, None))
+        # Shielded so one cancelled request doesn't cancel the call for the others
+        return await asyncio.shield(task)
     except Exception as e:
         print(f"Embedding generation failed: {e}")
         return None
 
 
-def create_property_description(property_data: Dict) -> str:
-    """Create a rich text description for embedding"""
-    parts = []
+async def warm_up_embedding_model() -> bool:
+    """
+    Send one embedding request so LM Studio loads the model now,
+    instead of during the first search (which has a short deadline).
+    """
+    try:
+        start = time.time()
+        await async_openai_client.embeddings.create(model=embedding_model, input="warm up")
+        print(f"[WARMUP] Embedding model ready in {time.time() - start:.2f}s")
+        return True
+    except Exception as e:
+        print(f"[WARNING] Embedding model warm-up failed: {e}")
+        return False
 
-    clip = property_data.get('clip', 'Unknown')
-    parts.append(f"Property ID {clip}")
-
-    # Address
-    addr = property_data.get('propertyAddress', {})
-    street = addr.get('streetAddress', '')
-    city = addr.get('city', '')
-    state = addr.get('state', '')
-    county = addr.get('county', '')
-
-    if street and city and state:
-        parts.append(f"Located at {street}, {city}, {state}")
-    if county:
-        parts.append(f"in {county} County")
-
-    # Property details
-    prop_details = property_data.get('property_details', {})
-    buildings = prop_details.get('allBuildingsSummary', {})
-
-    bedrooms = buildings.get('bedroomsCount')
-    bathrooms = buildings.get('bathroomsCount')
-    living_sqft = buildings.get('livingAreaSquareFeet')
-    total_sqft = buildings.get('totalAreaSquareFeet')
-
-    # Only add bedroom/bathroom info if they exist and are not null
-    if bedrooms and bathrooms:
-        parts.append(f"{bedrooms} bedroom, {bathrooms} bathroom property")
-    if living_sqft:
-        parts.append(f"with {living_sqft:,} square feet of living space")
-    elif total_sqft:
-        parts.append(f"with {total_sqft:,} total square feet")
-
-    # Site location
-    site = prop_details.get('siteLocation', {})
-    land_use = site.get('landUseAndZoningCodes', {})
-    state_land_use = land_use.get('stateLandUseDescription', '')
-
-    if state_land_use:
-        parts.append(f"Classified as {state_land_use.lower()}")
-
-    # Lot information
-    lot = site.get('lot', {})
-    lot_acres = lot.get('areaAcres')
-    if lot_acres:
-        parts.append(f"on {lot_acres:.2f} acre lot")
 
-    # Ownership
-    ownership = prop_details.get('ownership', {})
-    current_owners = ownership.get('currentOwners', {})
-    owner_names = current_owners.get('ownerNames', [])
+async def _embed_query(text: str, cache_key: str, cache) -> Optional[np.ndarray]:
+    """Call the model for one query and cache the normalized vector"""
+    response = await query_openai_client.embeddings.create(
+        model=embedding_model,
+        input=text
+    )
+    embedding = _validate_embedding(response.data[0].embedding)
+    if embedding is None:
+        return None
 
-    if owner_names and owner_names[0].get('fullName'):
-        owner_name = owner_names[0]['fullName']
-        is_corporate = owner_names[0].get('isCorporate', False)
-        ownership_type = "Corporate" if is_corporate else "Individual"
-        parts.append(f"Owned by {owner_name} ({ownership_type} ownership)")
+    vector = normalize_embedding(embedding)
+    await cache.set_raw(cache_key, encode_embedding(vector), Config.CACHE_EMBEDDING_TTL)
+    return vector
 
-    # Tax assessment
-    tax_assessments = prop_details.get('taxAssessment', [])
-    if tax_assessments:
-        tax = tax_assessments[0]
-        assessed_value = tax.get('assessedValue', {})
-        total_value = assessed_value.get('calculatedTotalValue')
-        tax_year = assessed_value.get('taxAssessedYear')
 
-        if total_value and tax_year:
-            parts.append(f"Assessed value ({tax_year}): ${total_value:,.0f}")
+def create_property_description(property_data: Dict) -> str:
+    """Create a rich text description for embedding"""
+    # Nested sections are looked up once; "or {}" also covers explicit nulls
+    addr = property_data.get('propertyAddress') or {}
+    prop_details = property_data.get('property_details') or {}
+    buildings = prop_details.get('allBuildingsSummary') or {}
+    site = prop_details.get('siteLocation') or {}
+    land_use = site.get('landUseAndZoningCodes') or {}
+    lot = site.get('lot') or {}
+    current_owners = (prop_details.get('ownership') or {}).get('currentOwners') or {}
+    owner_names = current_owners.get('ownerNames') or []
+    owner = owner_names[0] if owner_names else {}
+    tax_assessments = prop_details.get('taxAssessment') or []
+    assessed_value = (tax_assessments[0].get('assessedValue') or {}) if tax_assessments else {}
+
+    street, city, state, county = addr.get('streetAddress'), addr.get('city'), addr.get('state'), addr.get('county')
+    bedrooms, bathrooms = buildings.get('bedroomsCount'), buildings.get('bathroomsCount')
+    living_sqft, total_sqft = buildings.get('livingAreaSquareFeet'), buildings.get('totalAreaSquareFeet')
+    state_land_use = land_use.get('stateLandUseDescription')
+    lot_acres = lot.get('areaAcres')
+    owner_name = owner.get('fullName')
+    total_value, tax_year = assessed_value.get('calculatedTotalValue'), assessed_value.get('taxAssessedYear')
+
+    parts = (
+        f"Property ID {property_data.get('clip', 'Unknown')}",
+        f"Located at {street}, {city}, {state}" if street and city and state else None,
+        f"in {county} County" if county else None,
+        # Only add bedroom/bathroom info if they exist and are not null
+        f"{bedrooms} bedroom, {bathrooms} bathroom property" if bedrooms and bathrooms else None,
+        f"with {living_sqft:,} square feet of living space" if living_sqft
+        else f"with {total_sqft:,} total square feet" if total_sqft else None,
+        f"Classified as {state_land_use.lower()}" if state_land_use else None,
+        f"on {lot_acres:.2f} acre lot" if lot_acres else None,
+        f"Owned by {owner_name} ({'Corporate' if owner.get('isCorporate') else 'Individual'} ownership)"
+        if owner_name else None,
+        f"Assessed value ({tax_year}): ${total_value:,.0f}" if total_value and tax_year else None,
+    )
+    description = ". ".join(filter(None, parts)) + "."
+    if len(description) <= Config.MAX_DESCRIPTION_CHARS:
+        return description
+
+    # Over the embedding budget (e.g. very long owner names): keep parts in
+    # order, skipping any that would not fit
+    kept, length = [], -1
+    for part in filter(None, parts):
+        if length + len(part) + 2 <= Config.MAX_DESCRIPTION_CHARS:
+            kept.append(part)
+            length += len(part) + 2
+    return ". ".join(kept) + "."
+
+
+def prepare_property_document(property_data: Dict, description: str, embedding: List[float]) -> Dict:
+    """Add generated fields and convert coordinates so the property can be indexed"""
+    property_data['description'] = description
+    property_data['description_vector'] = quantize_embedding(embedding)
+
+    # Convert coordinates to geo_point format
+    if 'property_details' in property_data:
+        site = property_data['property_details'].get('siteLocation', {})
+
+        parcel_coords = site.get('coordinatesParcel', {})
+        if parcel_coords and 'lat' in parcel_coords and 'lng' in parcel_coords:
+            site['coordinatesParcel'] = {
+                "lat": parcel_coords['lat'],
+                "lon": parcel_coords['lng']
+            }
 
-    description = ". ".join(parts) + "."
-    return description
+    return property_data
 
 
-def index_property(property_data: Dict) -> bool:
-    """Index a single property with vector embedding"""
+def index_property(property_data: Dict, refresh: Union[bool, str] = False) -> bool:
+    """
+    Index a single property with vector embedding.
+    Pass refresh='wait_for' when the caller must read the document back right away.
+    """
     clip = property_data.get('clip', 'Unknown')
 
     try:
@@ -154,26 +389,14 @@ def index_property(property_data: Dict) -> bool:
             return False
 
         # Add generated fields ONLY if embedding was successful
-        property_data['description'] = description
-        property_data['description_vector'] = embedding
-
-        # Convert coordinates to geo_point format
-        if 'property_details' in property_data:
-            site = property_data['property_details'].get('siteLocation', {})
-
-            parcel_coords = site.get('coordinatesParcel', {})
-            if parcel_coords and 'lat' in parcel_coords and 'lng' in parcel_coords:
-                site['coordinatesParcel'] = {
-                    "lat": parcel_coords['lat'],
-                    "lon": parcel_coords['lng']
-                }
+        prepare_property_document(property_data, description, embedding)
 
         # Index in OpenSearch
         opensearch_client.index(
             index=Config.INDEX_NAME,
             id=clip,
             body=property_data,
-            refresh=True
+            refresh=refresh
         )
 
         print(f"[SUCCESS] ✅ Indexed {clip}\n")
@@ -186,6 +409,145 @@ def index_property(property_data: Dict) -> bool:
         return False
 
 
+def _build_bulk_actions(properties: List[Dict], descriptions: List[str],
+                        embeddings: List[Optional[List[float]]]) -> Tuple[List[Dict], int]:
+    """Build bulk index actions, skipping properties without an embedding"""
+    actions = []
+    failed_count = 0
+    for prop, description, embedding in zip(properties, descriptions, embeddings):
+        clip = prop.get('clip', 'Unknown')
+        if embedding is None:
+            print(f"[SKIP] {clip} - Embedding generation failed")
+            failed_count += 1
+            continue
+
+        actions.append({
+            "_op_type": "index",
+            "_index": Config.INDEX_NAME,
+            "_id": clip,
+            "_source": prepare_property_document(prop, description, embedding)
+        })
+
+    return actions, failed_count
+
+
+def index_properties_bulk(properties: List[Dict]) -> Tuple[int, int]:
+    """
+    Index many properties at once: batch the embedding requests,
+    send documents through the bulk API and refresh once at the end.
+    Returns: (indexed_count, failed_count)
+    """
+    if not properties:
+        return 0, 0
+
+    opensearch_client = get_opensearch_client()
+
+    descriptions = [create_property_description(prop) for prop in properties]
+
+    print(f"\n[BULK] Generating embeddings for {len(properties)} properties...")
+    start = time.time()
+    embeddings = generate_embeddings(descriptions)
+    print(f"   ✅ Embeddings generated in {time.time() - start:.2f}s")
+    check_quantization_scale(embeddings)
+
+    actions, failed_count = _build_bulk_actions(properties, descriptions, embeddings)
+    if not actions:
+        return 0, failed_count
+
+    indexed_count = 0
+    try:
+        # Documents go out in chunks without per-request refresh
+        for ok, item in helpers.streaming_bulk(opensearch_client, actions, raise_on_error=False,
+                                               **BULK_REQUEST_OPTIONS):
+            if ok:
+                indexed_count += 1
+            else:
+                print(f"[ERROR] ❌ Bulk index failure: {item}")
+                failed_count += 1
+
+        # Refresh once so the whole batch becomes searchable
+        opensearch_client.indices.refresh(index=Config.INDEX_NAME)
+    except Exception as e:
+        print(f"[ERROR] ❌ Bulk indexing failed: {e}")
+        return indexed_count, len(properties) - indexed_count
+
+    print(f"[SUCCESS] ✅ Bulk indexed {indexed_count}/{len(properties)} properties\n")
+    return indexed_count, failed_count
+
+
+async def index_properties_bulk_async(properties: List[Dict]) -> Tuple[int, int]:
+    """
+    Async variant of index_properties_bulk: embedding batches run concurrently
+    and documents go through the shared AsyncOpenSearch client.
+    Returns: (indexed_count, failed_count)
+    """
+    if not properties:
+        return 0, 0
+
+    opensearch_client = get_async_opensearch_client()
+
+    descriptions = [create_property_description(prop) for prop in properties]
+
+    print(f"\n[BULK] Generating embeddings for {len(properties)} properties...")
+    start = time.time()
+    embeddings = await generate_embeddings_async(descriptions)
+    print(f"   ✅ Embeddings generated in {time.time() - start:.2f}s")
+    check_quantization_scale(embeddings)
+
+    actions, failed_count = _build_bulk_actions(properties, descriptions, embeddings)
+    if not actions:
+        return 0, failed_count
+
+    indexed_count = 0
+    try:
+        async for ok, item in helpers.async_streaming_bulk(opensearch_client, actions, raise_on_error=False,
+                                                           **BULK_REQUEST_OPTIONS):
+            if ok:
+                indexed_count += 1
+            else:
+                print(f"[ERROR] ❌ Bulk index failure: {item}")
+                failed_count += 1
+
+        # Refresh once so the whole batch becomes searchable
+        await opensearch_client.indices.refresh(index=Config.INDEX_NAME)
+    except Exception as e:
+        print(f"[ERROR] ❌ Bulk indexing failed: {e}")
+        return indexed_count, len(properties) - indexed_count
+
+    print(f"[SUCCESS] ✅ Bulk indexed {indexed_count}/{len(properties)} properties\n")
+    return indexed_count, failed_count
+
+
+def get_vector_field_mapping() -> Dict:
+    """Mapping of the description_vector k-NN field"""
+    return {
+        "type": "knn_vector",
+        "dimension": Config.EMBEDDING_DIMENSION,
+        "data_type": "byte",  # int8 vectors: 4x less memory than float32
+        "method": {
+            "name": "hnsw",
+            "space_type": "innerproduct",  # Vectors are pre-normalized by quantize_embedding
+            "engine": Config.KNN_ENGINE,
+            "parameters": {
+                "ef_construction": 128,
+                "m": 16
+            }
+        }
+    }
+
+
+def is_vector_mapping_current(field_mapping: Dict) -> bool:
+    """Check an existing description_vector mapping against get_vector_field_mapping()"""
+    expected = get_vector_field_mapping()
+    return (
+        field_mapping.get('type') == expected['type']
+        and field_mapping.get('dimension') == expected['dimension']
+        and field_mapping.get('data_type', 'float') == expected['data_type']
+        and field_mapping.get('method', {}).get('space_type') == expected['method']['space_type']
+        and field_mapping.get('method', {}).get('engine') == expected['method']['engine']
+    )
+
+
 def create_index():
     """Create OpenSearch index with vector support"""
     opensearch_client = get_opensearch_client()
@@ -266,15 +628,7 @@ def create_index():
                     }
                 },
                 "description": {"type": "text"},
-                "description_vector": {
-                    "type": "knn_vector",
-                    "dimension": Config.EMBEDDING_DIMENSION,
-                    "method": {
-                        "name": "hnsw",
-                        "space_type": "cosinesimil",
-                        "engine": "lucene"
-                    }
-                }
+                "description_vector": get_vector_field_mapping()
             }
         }
     }
@@ -1,12 +1,67 @@
-from opensearchpy import OpenSearch
+import orjson
+from functools import lru_cache
+from opensearchpy import OpenSearch, AsyncOpenSearch
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
 from app.config import Config
 
-def get_opensearch_client():
-    """Get OpenSearch client instance"""
+_async_client = None
+
+
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer backed by orjson (vectors and large hit lists encode/decode in C)"""
+
+    def dumps(self, data):
+        # Strings (e.g. pre-built bulk bodies) are sent as-is
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except (orjson.JSONEncodeError, TypeError) as e:
+            raise SerializationError(data, e)
+
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except (orjson.JSONDecodeError, TypeError) as e:
+            raise SerializationError(s, e)
+
+
+@lru_cache(maxsize=1)
+def get_opensearch_client() -> OpenSearch:
+    """Get the shared OpenSearch client (connections are pooled and reused)"""
     return OpenSearch(
         hosts=[{'host': Config.OPENSEARCH_HOST, 'port': Config.OPENSEARCH_PORT}],
         http_auth=(Config.OPENSEARCH_USER, Config.OPENSEARCH_PASSWORD),
         use_ssl=True,
         verify_certs=False,
-        ssl_show_warn=False
-    )
\ No newline at end of file
+        ssl_show_warn=False,
+        pool_maxsize=Config.OPENSEARCH_POOL_MAXSIZE,
+        http_compress=Config.OPENSEARCH_HTTP_COMPRESS,
+        serializer=OrjsonSerializer()
+    )
+
+
+def get_async_opensearch_client() -> AsyncOpenSearch:
+    """Get the shared async OpenSearch client (one connection pool per worker)"""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenSearch(
+            hosts=[{'host': Config.OPENSEARCH_HOST, 'port': Config.OPENSEARCH_PORT}],
+            http_auth=(Config.OPENSEARCH_USER, Config.OPENSEARCH_PASSWORD),
+            use_ssl=True,
+            verify_certs=False,
+            ssl_show_warn=False,
+            maxsize=Config.OPENSEARCH_POOL_MAXSIZE,
+            http_compress=Config.OPENSEARCH_HTTP_COMPRESS,
+            serializer=OrjsonSerializer()
+        )
+    return _async_client
+
+
+async def close_async_opensearch_client():
+    """Close the shared async OpenSearch client"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
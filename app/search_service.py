@@ -1,14 +1,113 @@
 import re
+import json
 import time
+import asyncio
 import hashlib
+import logging
+import numpy as np
 from typing import Dict, Optional, List
 from app.config import Config
-from app.opensearch_client import get_opensearch_client
-from app.indexer import generate_embedding
+from app.cache import get_cache_service, SimilarQueryIndex
+from app.opensearch_client import get_async_opensearch_client
+from app.indexer import (
+    generate_embedding_async,
+    get_embedding_cache_key,
+    decode_embedding,
+    quantize_embedding
+)
+
+# Per-request trace lines (cache hits, prefetches); debug level, so they cost
+# nothing unless enabled. Warnings and errors are still printed.
+logger = logging.getLogger(__name__)
 
 # Cache configuration
-query_cache = {}
-CACHE_TTL = 300  # 5 minutes
+CACHE_PREFIX = "cache:hybrid:"
+LOCK_PREFIX = "lock:"
+CACHE_TTL = Config.CACHE_QUERY_RESULTS_TTL
+LOCK_WAIT_INTERVAL = 0.05  # Seconds between polls while another request refreshes
+# Only the fields /api/search returns (see shape_search_hit in main.py);
+# skips the vector and the rest of the CoreLogic document
+SOURCE_FILTER = {"includes": [
+    "clip",
+    "propertyAddress",
+    "description",
+    "property_details.allBuildingsSummary.bedroomsCount",
+    "property_details.allBuildingsSummary.bathroomsCount",
+    "property_details.allBuildingsSummary.livingAreaSquareFeet",
+    "property_details.allBuildingsSummary.totalAreaSquareFeet",
+    "property_details.taxAssessment.assessedValue.calculatedTotalValue",
+    "property_details.taxAssessment.assessedValue.taxAssessedYear"
+]}
+# Response fields the callers read; drops _index/_id/_shards metadata per hit.
+# OpenSearch omits hits.hits entirely when a page is empty
+SEARCH_FILTER_PATH = "hits.total,hits.hits._score,hits.hits._source"
+QUERY_HITS_KEY = "query:hits"  # Sorted set of normalized query -> request count
+WARM_PAGE_SIZE = 20  # Page size used by the cache warmer (the API default)
+WARM_LOCK_KEY = LOCK_PREFIX + "cache-warming"  # Held by the worker warming this cycle
+
+# Query parser patterns, compiled once at import
+BEDROOM_RE = re.compile(r'(\d+)\s*(?:bed(?:room)?s?|br)')
+BATHROOM_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:bath(?:room)?s?)')
+UNDER_RE = re.compile(r'(?:under|below|less than|max)\s*\$?\s*([\d,]+)k?')
+OVER_RE = re.compile(r'(?:over|above|more than|min)\s*\$?\s*([\d,]+)k?')
+SQFT_RE = re.compile(r'(\d+)\s*(?:sq\.?\s*ft|square\s*feet|sqft)')
+STATE_RE = re.compile(r'\b([A-Z]{2})\b')
+COUNTY_RE = re.compile(r'(\w+)\s+county')
+ACRES_RE = re.compile(r'(\d+(?:\.\d+)?)\s*acres?')
+# Punctuation, except '$' and '.'/',' inside numbers ("2.5", "500,000")
+PUNCTUATION_RE = re.compile(r'[^\w\s$.,]|(?<!\d)[.,]|[.,](?!\d)')
+
+CITIES = (
+    'honolulu', 'san francisco', 'los angeles', 'new york', 'chicago',
+    'houston', 'phoenix', 'philadelphia', 'san antonio', 'san diego',
+    'dallas', 'austin', 'seattle', 'denver', 'boston', 'portland',
+    'miami', 'atlanta', 'las vegas', 'detroit', 'nashville'
+)
+
+# Keyword tables as single alternations: one C-level scan per group
+# Longest names first, so a multi-word city always wins over a shorter prefix
+CITY_RE = re.compile(r'\b(' + '|'.join(sorted(map(re.escape, CITIES), key=len, reverse=True)) + r')\b')
+LAND_USE_RE = re.compile(r'\b(residential|commercial|industrial)\b')
+CORPORATE_RE = re.compile(r'corporate|company')
+SORT_PRICE_ASC_RE = re.compile(r'cheap|affordable|lowest|least expensive')
+SORT_PRICE_DESC_RE = re.compile(r'expensive|luxury|highest|most valuable')
+SORT_SIZE_DESC_RE = re.compile(r'largest|biggest')
+SORT_SIZE_ASC_RE = re.compile(r'smallest')
+
+# Words fully covered by the filters above; a query made only of these
+# (plus generic words) has no semantic content left to embed
+FILTER_TERMS_RE = re.compile(
+    r'\$?\d[\d,.]*k?|\b(?:bed(?:room)?s?|br|bath(?:room)?s?|under|below|less than|max|over|above|more than|min'
+    r'|sq ft|sqft|square feet|acres?|residential|commercial|industrial|corporate|company|owned'
+    r'|cheap\w*|affordable|lowest|least expensive|expensive|luxury|highest|most valuable'
+    r'|largest|biggest|smallest)\b'
+)
+GENERIC_QUERY_WORDS = frozenset({
+    'a', 'an', 'the', 'in', 'on', 'at', 'of', 'with', 'and', 'or', 'for', 'by', 'to', 'than', 'plus',
+    'property', 'properties', 'home', 'homes', 'house', 'houses', 'lot', 'lots', 'parcel', 'parcels',
+    'land', 'building', 'buildings', 'show', 'find', 'me', 'all', 'any'
+})
+
+# Keeps references to fire-and-forget background tasks until they finish
+_background_tasks = set()
+
+# Recent cached queries, for reusing results of near-duplicate searches
+_similar_queries = SimilarQueryIndex(Config.CACHE_SIMILARITY_SIZE, Config.EMBEDDING_DIMENSION)
+
+
+async def _log_failure(coro):
+    """Await a background coroutine, logging its exception instead of leaving it unretrieved"""
+    try:
+        await coro
+    except Exception as e:
+        print(f"[WARNING] Background task failed: {e}")
+
+
+def _run_in_background(coro):
+    """Schedule a coroutine without awaiting it"""
+    task = asyncio.create_task(_log_failure(coro))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 def parse_query_fast(user_input: str) -> Dict:
@@ -21,21 +120,21 @@ def parse_query_fast(user_input: str) -> Dict:
     sort_by = None
 
     # Extract bedrooms
-    bedroom_match = re.search(r'(\d+)\s*(?:bed(?:room)?s?|br)', query)
+    bedroom_match = BEDROOM_RE.search(query)
     if bedroom_match:
         filters["must"].append({
             "term": {"property_details.allBuildingsSummary.bedroomsCount": int(bedroom_match.group(1))}
         })
 
     # Extract bathrooms
-    bathroom_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:bath(?:room)?s?)', query)
+    bathroom_match = BATHROOM_RE.search(query)
     if bathroom_match:
         filters["must"].append({
             "term": {"property_details.allBuildingsSummary.bathroomsCount": int(float(bathroom_match.group(1)))}
         })
 
     # Extract assessed value - under/below
-    under_match = re.search(r'(?:under|below|less than|max)\s*\$?\s*([\d,]+)k?', query)
+    under_match = UNDER_RE.search(query)
     if under_match:
         value = int(under_match.group(1).replace(',', ''))
         if 'k' in under_match.group(0).lower() and value < 10000:
@@ -52,7 +151,7 @@ def parse_query_fast(user_input: str) -> Dict:
         })
 
     # Extract assessed value - over/above
-    over_match = re.search(r'(?:over|above|more than|min)\s*\$?\s*([\d,]+)k?', query)
+    over_match = OVER_RE.search(query)
     if over_match:
         value = int(over_match.group(1).replace(',', ''))
         if 'k' in over_match.group(0).lower() and value < 10000:
@@ -69,7 +168,7 @@ def parse_query_fast(user_input: str) -> Dict:
         })
 
     # Extract square footage
-    sqft_match = re.search(r'(\d+)\s*(?:sq\.?\s*ft|square\s*feet|sqft)', query)
+    sqft_match = SQFT_RE.search(query)
     if sqft_match:
         sqft = int(sqft_match.group(1))
         filters["filter"].append({
@@ -78,45 +177,33 @@ def parse_query_fast(user_input: str) -> Dict:
             }
         })
 
-    # Extract cities (expanded list)
-    cities = [
-        'honolulu', 'san francisco', 'los angeles', 'new york', 'chicago',
-        'houston', 'phoenix', 'philadelphia', 'san antonio', 'san diego',
-        'dallas', 'austin', 'seattle', 'denver', 'boston', 'portland',
-        'miami', 'atlanta', 'las vegas', 'detroit', 'nashville'
-    ]
-
-    for city in cities:
-        if city in query:
-            filters["must"].append({"term": {"propertyAddress.city": city.upper()}})
-            break
+    # Extract cities
+    city_match = CITY_RE.search(query)
+    if city_match:
+        filters["must"].append({"term": {"propertyAddress.city": city_match.group(1).upper()}})
 
     # Extract states (2-letter codes)
-    state_match = re.search(r'\b([A-Z]{2})\b', user_input)
+    state_match = STATE_RE.search(user_input)
     if state_match:
         filters["must"].append({"term": {"propertyAddress.state": state_match.group(1)}})
 
     # Extract counties
-    county_match = re.search(r'(\w+)\s+county', query)
+    county_match = COUNTY_RE.search(query)
     if county_match:
         filters["must"].append({"term": {"propertyAddress.county": county_match.group(1).upper()}})
 
     # Land use type
-    if 'residential' in query:
-        filters["must"].append({
-            "term": {"property_details.siteLocation.landUseAndZoningCodes.stateLandUseDescription": "RESIDENTIAL"}
-        })
-    elif 'commercial' in query:
+    land_use_match = LAND_USE_RE.search(query)
+    if land_use_match:
         filters["must"].append({
-            "term": {"property_details.siteLocation.landUseAndZoningCodes.stateLandUseDescription": "COMMERCIAL"}
-        })
-    elif 'industrial' in query:
-        filters["must"].append({
-            "term": {"property_details.siteLocation.landUseAndZoningCodes.stateLandUseDescription": "INDUSTRIAL"}
+            "term": {
+                "property_details.siteLocation.landUseAndZoningCodes.stateLandUseDescription":
+                    land_use_match.group(1).upper()
+            }
         })
 
     # Corporate ownership filter
-    if 'corporate' in query or 'company' in query:
+    if CORPORATE_RE.search(query):
         filters["filter"].append({
             "nested": {
                 "path": "property_details.ownership.currentOwners.ownerNames",
@@ -127,7 +214,7 @@ def parse_query_fast(user_input: str) -> Dict:
         })
 
     # Lot size (acres)
-    acres_match = re.search(r'(\d+(?:\.\d+)?)\s*acres?', query)
+    acres_match = ACRES_RE.search(query)
     if acres_match:
         acres = float(acres_match.group(1))
         filters["filter"].append({
@@ -135,44 +222,71 @@ def parse_query_fast(user_input: str) -> Dict:
         })
 
     # Sorting
-    if any(word in query for word in ['cheap', 'affordable', 'lowest', 'least expensive']):
+    if SORT_PRICE_ASC_RE.search(query):
         sort_by = [{
             "property_details.taxAssessment.assessedValue.calculatedTotalValue": {
                 "order": "asc",
                 "nested": {"path": "property_details.taxAssessment"}
             }
         }]
-    elif any(word in query for word in ['expensive', 'luxury', 'highest', 'most valuable']):
+    elif SORT_PRICE_DESC_RE.search(query):
         sort_by = [{
             "property_details.taxAssessment.assessedValue.calculatedTotalValue": {
                 "order": "desc",
                 "nested": {"path": "property_details.taxAssessment"}
             }
         }]
-    elif any(word in query for word in ['largest', 'biggest']):
+    elif SORT_SIZE_DESC_RE.search(query):
         sort_by = [{"property_details.allBuildingsSummary.livingAreaSquareFeet": {"order": "desc"}}]
-    elif any(word in query for word in ['smallest']):
+    elif SORT_SIZE_ASC_RE.search(query):
         sort_by = [{"property_details.allBuildingsSummary.livingAreaSquareFeet": {"order": "asc"}}]
 
     return {"filters": filters, "sort": sort_by}
 
 
-def get_cache_key(query: str, page: int) -> str:
-    """Generate cache key from query and page"""
-    normalized = f"{query.lower().strip()}_{page}"
-    return hashlib.md5(normalized.encode()).hexdigest()
+def normalize_query(user_input: str) -> str:
+    """Collapse punctuation and whitespace so trivially different queries match"""
+    return " ".join(PUNCTUATION_RE.sub(" ", user_input).split())
+
+
+def is_filter_only_query(user_query: str, parsed: Dict) -> bool:
+    """True when the parsed filters cover the whole query, so an embedding adds nothing"""
+    if not (parsed["filters"]["must"] or parsed["filters"]["filter"] or parsed.get("sort")):
+        return False
+
+    residual = STATE_RE.sub(" ", user_query).lower()
+    residual = COUNTY_RE.sub(" ", residual)
+    residual = CITY_RE.sub(" ", residual)
+    residual = FILTER_TERMS_RE.sub(" ", residual)
+    return set(residual.split()) <= GENERIC_QUERY_WORDS
+
 
+def has_filters(parsed: Dict) -> bool:
+    """True when the parsed query restricts results beyond the semantic match"""
+    return bool(parsed["filters"]["must"] or parsed["filters"]["filter"])
 
-def clean_cache():
-    """Remove expired cache entries"""
-    current_time = time.time()
-    expired = [k for k, v in query_cache.items()
-               if current_time - v['cached_at'] > CACHE_TTL]
-    for k in expired:
-        del query_cache[k]
 
+def get_cache_key(query: str, page: int, size: int) -> str:
+    """Generate cache key from query, page and page size"""
+    normalized = f"{query.lower().strip()}_{page}_{size}"
+    return CACHE_PREFIX + hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
 
-def hybrid_search(user_query: str, page: int = 1, size: int = 20, use_cache: bool = True) -> Optional[Dict]:
+
+def _from_cache(user_query: str, cached: Dict) -> Dict:
+    """Build a response from a cache entry"""
+    logger.debug("[CACHE HIT] %s", user_query)
+
+    # Add performance metadata
+    cached_result = cached['result'].copy()
+    cached_result['performance'] = {
+        'total_time_ms': round((time.time() - cached['cached_at']) * 1000, 1),
+        'method': 'cached',
+        'from_cache': True
+    }
+    return cached_result
+
+
+async def hybrid_search(user_query: str, page: int = 1, size: int = 20, use_cache: bool = True) -> Optional[Dict]:
     """
     Hybrid search with caching and optimized performance
 
@@ -182,22 +296,57 @@ def hybrid_search(user_query: str, page: int = 1, size: int = 20, use_cache: boo
     - Keyword only: ~130ms
     """
 
-    # Check cache first (fastest path)
+    # "3-bedroom  Honolulu" and "3 bedroom Honolulu" are the same search
+    user_query = normalize_query(user_query)
+
+    cache = await get_cache_service()
+    cache_key = get_cache_key(user_query, page, size)
+    lock_key = LOCK_PREFIX + cache_key
+    lock_token = None
+    cached_embedding = None
+    cacheable = use_cache and page == 1  # Only the first page is cached
+
+    # Count first-page requests so the cache warmer knows the popular queries
+    if page == 1:
+        _run_in_background(cache.increment_score(QUERY_HITS_KEY, user_query))
+
+    # Check cache first (fastest path). The query embedding is probed in the
+    # same round trip, so a result miss doesn't cost a second cache lookup
     if use_cache:
-        cache_key = get_cache_key(user_query, page)
-        if cache_key in query_cache:
-            cached = query_cache[cache_key]
-            print(f"[CACHE HIT] {user_query}")
-
-            # Add performance metadata
-            cached_result = cached['result'].copy()
-            cached_result['performance'] = {
-                'total_time_ms': round((time.time() - cached['cached_at']) * 1000, 1),
-                'method': 'cached',
-                'from_cache': True
-            }
-            return cached_result
+        cached, cached_embedding = await cache.get_with_raw(cache_key, get_embedding_cache_key(user_query))
+        if cached:
+            return _from_cache(user_query, cached)
+
+    # Only one request refreshes a missing entry; the others wait for it
+    # briefly instead of all hitting the embedding model and OpenSearch
+    if cacheable:
+        lock_token = await cache.acquire_lock(lock_key, Config.CACHE_LOCK_TTL)
+        waited = 0.0
+        while not lock_token and waited < Config.CACHE_LOCK_TTL:
+            await asyncio.sleep(LOCK_WAIT_INTERVAL)
+            waited += LOCK_WAIT_INTERVAL
+            cached = await cache.get(cache_key)
+            if cached:
+                return _from_cache(user_query, cached)
+            # The refresher finished without caching (e.g. search failed)
+            lock_token = await cache.acquire_lock(lock_key, Config.CACHE_LOCK_TTL)
+
+    try:
+        return await _run_hybrid_search(user_query, page, size, cacheable, cache, cache_key,
+                                        cached_embedding, embedding_probed=use_cache)
+    finally:
+        if lock_token:
+            await cache.release_lock(lock_key, lock_token)
+
 
+async def _run_hybrid_search(user_query: str, page: int, size: int, cacheable: bool,
+                             cache, cache_key: str, cached_embedding: Optional[bytes] = None,
+                             embedding_probed: bool = False) -> Optional[Dict]:
+    """
+    Execute the hybrid search and store the result in the cache.
+    embedding_probed: the embedding cache was already checked (and missed
+    unless cached_embedding is set), so it is not read again.
+    """
     start_time = time.time()
 
     # Parse query for filters (fast - ~2ms)
@@ -205,56 +354,53 @@ def hybrid_search(user_query: str, page: int = 1, size: int = 20, use_cache: boo
     parsed = parse_query_fast(user_query)
     parse_time = time.time() - parse_start
 
-    opensearch_client = get_opensearch_client()
+    # "3 bedroom Honolulu under 500k" is answered exactly by the filters
+    if is_filter_only_query(user_query, parsed):
+        response = await search_keyword_only(parsed, page, size)
+        if response:
+            response['performance']['parse_time_ms'] = round(parse_time * 1000, 1)
+            response['performance']['method'] = 'keyword_only_autodetected'
+            if cacheable:
+                await cache.set(cache_key, {
+                    'result': response,
+                    'cached_at': time.time()
+                }, CACHE_TTL)
+        return response
 
     # Generate embedding for semantic search
     embedding_start = time.time()
-    query_vector = generate_embedding(user_query)
+    keyword_task = None
+    if cached_embedding:
+        query_vector = decode_embedding(cached_embedding)
+    else:
+        # Start the keyword search next to the model call: it is the fallback
+        # if the embedding or the k-NN query fails
+        if has_filters(parsed):
+            keyword_task = asyncio.create_task(search_keyword_only(parsed, page, size))
+        query_vector = await generate_embedding_async(user_query, skip_cache_probe=embedding_probed)
     embedding_time = time.time() - embedding_start
 
-    if not query_vector:
+    if query_vector is None:
         print("[WARNING] Embedding failed, using keyword-only search")
-        return search_keyword_only(parsed, page, size)
-
-    # Build hybrid query
-    search_start = time.time()
-    query_body = {
-        "size": size,
-        "from": (page - 1) * size,
-        "query": {
-            "bool": {
-                "must": [
-                    {
-                        "knn": {
-                            "description_vector": {
-                                "vector": query_vector,
-                                "k": 100  # Find top 100 nearest neighbors
-                            }
-                        }
-                    }
-                ]
-            }
-        }
-    }
-
-    # Add keyword filters
-    if parsed["filters"]["must"]:
-        query_body["query"]["bool"]["must"].extend(parsed["filters"]["must"])
-    if parsed["filters"]["filter"]:
-        query_body["query"]["bool"]["filter"] = parsed["filters"]["filter"]
-
-    # Add sorting
-    if parsed.get("sort"):
-        query_body["sort"] = parsed["sort"]
-
-    query_body["timeout"] = "500ms"
+        if keyword_task:
+            return await keyword_task
+        return await search_keyword_only(parsed, page, size)
+
+    # A near-identical query with the same filters may already be cached
+    signature = f"{json.dumps(parsed, sort_keys=True)}|{page}|{size}"
+    if cacheable:
+        similar_key = _similar_queries.find(query_vector, signature, Config.CACHE_SIMILARITY_THRESHOLD)
+        if similar_key and similar_key != cache_key:
+            cached = await cache.get(similar_key)
+            if cached:
+                if keyword_task:
+                    keyword_task.cancel()
+                await cache.set(cache_key, cached, CACHE_TTL)
+                return _from_cache(user_query, cached)
 
     try:
-        response = opensearch_client.search(
-            index=Config.INDEX_NAME,
-            body=query_body,
-            request_timeout=2
-        )
+        search_start = time.time()
+        response = await execute_hybrid_query(parsed, query_vector, page, size, keyword_task)
         search_time = time.time() - search_start
         total_time = time.time() - start_time
 
@@ -269,13 +415,18 @@ def hybrid_search(user_query: str, page: int = 1, size: int = 20, use_cache: boo
         }
 
         # Cache the result (only cache first page)
-        if use_cache and page == 1:
-            cache_key = get_cache_key(user_query, page)
-            query_cache[cache_key] = {
+        if cacheable:
+            await cache.set(cache_key, {
                 'result': response,
                 'cached_at': time.time()
-            }
-            clean_cache()  # Clean expired entries
+            }, CACHE_TTL)
+            _similar_queries.add(query_vector, signature, cache_key)
+
+            # Users usually paginate forward: warm the next page in the background
+            if Config.CACHE_PREFETCH_NEXT_PAGE and response['hits']['total']['value'] > page * size:
+                _run_in_background(
+                    prefetch_page(user_query, parsed, query_vector, page + 1, size, cache)
+                )
 
         return response
 
@@ -284,16 +435,97 @@ def hybrid_search(user_query: str, page: int = 1, size: int = 20, use_cache: boo
         return None
 
 
-def search_keyword_only(parsed_filters: Dict, page: int = 1, size: int = 20) -> Optional[Dict]:
+async def prefetch_page(user_query: str, parsed: Dict, query_vector: np.ndarray,
+                        page: int, size: int, cache):
+    """Run the search for a page ahead of time and store it in the cache"""
+    cache_key = get_cache_key(user_query, page, size)
+    try:
+        if await cache.get(cache_key):
+            return
+
+        response = await execute_hybrid_query(parsed, query_vector, page, size)
+        response['performance'] = {
+            'method': 'hybrid_semantic',
+            'prefetched': True,
+            'from_cache': False
+        }
+        await cache.set(cache_key, {
+            'result': response,
+            'cached_at': time.time()
+        }, CACHE_TTL)
+        logger.debug("[PREFETCH] %s (page %d)", user_query, page)
+    except Exception as e:
+        print(f"[WARNING] Prefetch of page {page} failed: {e}")
+
+
+async def execute_hybrid_query(parsed: Dict, query_vector: np.ndarray, page: int, size: int,
+                               keyword_task: Optional[asyncio.Task] = None) -> Dict:
     """
-    Fallback to keyword-only search if embeddings fail
-    Faster but less intelligent than hybrid search
+    Build and run the hybrid k-NN + filters query for one page.
+    Filtered queries fall back to keyword results if the k-NN query fails;
+    keyword_task is an already running search_keyword_only for the same page,
+    used as that fallback and cancelled otherwise.
     """
-    opensearch_client = get_opensearch_client()
+    opensearch_client = get_async_opensearch_client()
+
+    # Build hybrid query
+    query_body = {
+        "size": size,
+        "from": (page - 1) * size,
+        "_source": SOURCE_FILTER,
+        "query": {
+            "knn": {
+                "description_vector": {
+                    "vector": quantize_embedding(query_vector),
+                    "k": 100  # Find top 100 nearest neighbors
+                }
+            }
+        }
+    }
+
+    # Add keyword filters inside the k-NN clause: Lucene applies them during the
+    # graph search, so the k neighbours returned all match (filtering the top 100
+    # afterwards could leave few or none). The clauses are all exact term/range
+    # matches, so the ranking is the vector similarity either way.
+    if has_filters(parsed):
+        query_body["query"]["knn"]["description_vector"]["filter"] = {"bool": parsed["filters"]}
+
+    # Add sorting
+    if parsed.get("sort"):
+        query_body["sort"] = parsed["sort"]
+
+    query_body["timeout"] = "500ms"
 
+    # Every page is cut from this one ranked k-NN list, so pages never overlap
+    # (topping short pages up with keyword hits repeated earlier results)
+    try:
+        response = await opensearch_client.search(
+            index=Config.INDEX_NAME,
+            body=query_body,
+            filter_path=SEARCH_FILTER_PATH,
+            request_timeout=2
+        )
+    except Exception as e:
+        if not has_filters(parsed):
+            raise
+        # The filters alone still answer the query, just without semantic ranking
+        print(f"[WARNING] Semantic query failed ({e}), using keyword results")
+        response = await (keyword_task or search_keyword_only(parsed, page, size))
+        if response is None:
+            raise RuntimeError("Both semantic and keyword queries failed")
+        return response
+
+    if keyword_task is not None:
+        keyword_task.cancel()
+    return response
+
+
+def build_keyword_query(parsed_filters: Dict, page: int = 1, size: int = 20) -> Dict:
+    """Build the filters-only query body used by keyword search"""
     query_body = {
         "size": size,
         "from": (page - 1) * size,
+        "_source": SOURCE_FILTER,
         "query": {
             "bool": parsed_filters.get("filters", {"must": [], "filter": []})
         }
@@ -302,11 +534,24 @@ def search_keyword_only(parsed_filters: Dict, page: int = 1, size: int = 20) ->
     if parsed_filters.get("sort"):
         query_body["sort"] = parsed_filters["sort"]
 
+    return query_body
+
+
+async def search_keyword_only(parsed_filters: Dict, page: int = 1, size: int = 20) -> Optional[Dict]:
+    """
+    Fallback to keyword-only search if embeddings fail
+    Faster but less intelligent than hybrid search
+    """
+    opensearch_client = get_async_opensearch_client()
+
+    query_body = build_keyword_query(parsed_filters, page, size)
+
     try:
         start_time = time.time()
-        response = opensearch_client.search(
+        response = await opensearch_client.search(
             index=Config.INDEX_NAME,
             body=query_body,
+            filter_path=SEARCH_FILTER_PATH,
             request_timeout=1
         )
         total_time = time.time() - start_time
@@ -325,23 +570,59 @@ def search_keyword_only(parsed_filters: Dict, page: int = 1, size: int = 20) ->
         return None
 
 
-def get_cache_stats() -> Dict:
-    """Get cache statistics"""
+async def warm_cache() -> int:
+    """Re-run the most frequent queries so their first page stays cached"""
+    cache = await get_cache_service()
+
+    # With a shared Redis cache, one worker warms per interval. The lock is
+    # left to expire rather than released, so the other workers skip this cycle
+    if not await cache.acquire_lock(WARM_LOCK_KEY, Config.CACHE_WARMING_INTERVAL):
+        return 0
+
+    top_queries = await cache.top_scored(QUERY_HITS_KEY, Config.CACHE_WARMING_TOP_K)
+
+    warmed = 0
+    for query, _ in top_queries:
+        cache_key = get_cache_key(query, 1, WARM_PAGE_SIZE)
+        if await _run_hybrid_search(query, 1, WARM_PAGE_SIZE, True, cache, cache_key):
+            warmed += 1
+    return warmed
+
+
+async def cache_warmer_loop():
+    """Periodically refresh the cache for the top queries"""
+    while True:
+        try:
+            start_time = time.time()
+            warmed = await warm_cache()
+            if warmed:
+                print(f"[CACHE WARM] Refreshed {warmed} queries in {time.time() - start_time:.1f}s")
+        except Exception as e:
+            print(f"[WARNING] Cache warming failed: {e}")
+        await asyncio.sleep(Config.CACHE_WARMING_INTERVAL)
+
+
+async def get_cache_stats(sample: int = 5) -> Dict:
+    """Get cache statistics (sample: how many entries to list with their age)"""
+    cache = await get_cache_service()
+    available, info = await asyncio.gather(cache.ping(), cache.entries(CACHE_PREFIX, limit=sample))
     return {
-        'total_entries': len(query_cache),
+        'backend': cache.backend,
+        'available': available,
+        'total_entries': info['count'],
+        'total_is_exact': info['complete'],
         'ttl_seconds': CACHE_TTL,
         'entries': [
             {
-                'query': list(query_cache.keys())[i][:50] + '...',
-                'age_seconds': round(time.time() - v['cached_at'], 1)
+                'key': key,
+                'age_seconds': round(CACHE_TTL - ttl_remaining, 1)
             }
-            for i, v in enumerate(list(query_cache.values())[:5])
+            for key, ttl_remaining in info['sample']
         ]
     }
 
 
-def clear_cache():
+async def clear_cache():
     """Clear all cache entries"""
-    count = len(query_cache)
-    query_cache.clear()
-    return count
\ No newline at end of file
+    cache = await get_cache_service()
+    return await cache.clear(CACHE_PREFIX)
\ No newline at end of file
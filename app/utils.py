@@ -1,7 +1,15 @@
-import json
 import os
+import orjson
 from typing import Dict, Any
 from datetime import datetime
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (much faster than stdlib json on large payloads)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
 
 
 def save_to_json(data: Dict[str, Any], filename: str, output_dir: str = "data/output"):
@@ -9,8 +17,8 @@ def save_to_json(data: Dict[str, Any], filename: str, output_dir: str = "data/ou
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     print(f"Data saved to: {filepath}")
 
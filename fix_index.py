@@ -3,10 +3,10 @@ Complete Fix Script for OpenSearch Index
 Deletes, recreates, and reloads data with proper vector mappings
 """
 
-import json
 import sys
+import orjson
 from app.opensearch_client import get_opensearch_client
-from app.indexer import create_index, index_property
+from app.indexer import create_index, index_properties_bulk, is_vector_mapping_current
 from app.config import Config
 
 
@@ -53,12 +53,14 @@ def main():
         has_description_vector = 'description_vector' in properties
         is_knn_vector = properties.get('description_vector', {}).get('type') == 'knn_vector'
         vector_dim = properties.get('description_vector', {}).get('dimension')
+        vector_data_type = properties.get('description_vector', {}).get('data_type', 'float')
 
         print(f"   ✓ description_vector field exists: {has_description_vector}")
         print(f"   ✓ description_vector is knn_vector type: {is_knn_vector}")
         print(f"   ✓ Vector dimension: {vector_dim}")
+        print(f"   ✓ Vector data type: {vector_data_type}")
 
-        if not (has_description_vector and is_knn_vector and vector_dim == Config.EMBEDDING_DIMENSION):
+        if not is_vector_mapping_current(properties.get('description_vector', {})):
             print("❌ Index mapping is incorrect!")
             return False
 
@@ -71,8 +73,8 @@ def main():
     # Step 4: Load and index data
     print(f"\n[STEP 4/4] Loading data from property_search_data.json...")
     try:
-        with open('data/output/property_search_data.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open('data/output/property_search_data.json', 'rb') as f:
+            data = orjson.loads(f.read())
 
         # Handle CoreLogic structure
         if isinstance(data, dict) and 'items' in data:
@@ -84,25 +86,20 @@ def main():
 
         print(f"   Found {len(properties)} properties to index")
 
-        # Index each property with progress
+        # Embeddings are requested in batches and documents sent through the
+        # bulk API; the index is refreshed once at the end
         print("\n   Indexing properties with embeddings...")
-        indexed_count = 0
-        failed_count = 0
-
-        for i, prop in enumerate(properties, 1):
-            clip = prop.get('clip', 'Unknown')
-            print(f"   [{i}/{len(properties)}] Property {clip}...", end=" ")
-
-            if index_property(prop):
-                indexed_count += 1
-                print("✅")
-            else:
-                failed_count += 1
-                print("❌")
+        # No periodic refreshes during the load: each one would flush a new
+        # segment and build its HNSW graph (replicas are already 0)
+        client.indices.put_settings(index=Config.INDEX_NAME, body={"index": {"refresh_interval": "-1"}})
+        try:
+            indexed_count, failed_count = index_properties_bulk(properties)
+        finally:
+            client.indices.put_settings(index=Config.INDEX_NAME, body={"index": {"refresh_interval": None}})
 
-        # Refresh index to make documents searchable immediately
-        print("\n   Refreshing index...")
-        client.indices.refresh(index=Config.INDEX_NAME)
+        # Merge the load into one segment so k-NN queries search a single graph
+        print("   Merging segments...")
+        client.indices.forcemerge(index=Config.INDEX_NAME, max_num_segments=1, request_timeout=600)
 
         # Verify documents were indexed
         count = client.count(index=Config.INDEX_NAME)
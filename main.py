@@ -1,21 +1,44 @@
-from fastapi import FastAPI, HTTPException
+import time
+import asyncio
+import hashlib
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI, HTTPException, Response, Header
+from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any
-from app.api_client import CoreLogicAPIClient
-from app.utils import save_to_json, generate_filename
-from app.indexer import index_property, create_index
+from app.api_client import CoreLogicAPIClient, get_corelogic_client
+from app.utils import save_to_json, generate_filename, ORJSONResponse
+from app.indexer import (
+    index_properties_bulk,
+    index_properties_bulk_async,
+    create_index,
+    is_vector_mapping_current,
+    warm_up_embedding_model
+)
 from app.search_service import (
     hybrid_search,
     get_cache_stats,
+    cache_warmer_loop,
     clear_cache as clear_search_cache
 )
-from app.opensearch_client import get_opensearch_client
+from app.opensearch_client import (
+    get_opensearch_client,
+    get_async_opensearch_client,
+    close_async_opensearch_client
+)
+from app.cache import get_cache_service, close_cache_service
 from app.config import Config
 
 app = FastAPI(
     title="Property Data API with OpenSearch",
     description="API for loading, indexing, and searching CoreLogic property data with semantic search and caching",
-    version="2.1.0"
+    version="2.1.0",
+    default_response_class=ORJSONResponse,
+    # Spec and docs are served below from a pre-serialized buffer
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None
 )
 
 
@@ -52,7 +75,25 @@ class SearchRequest(BaseModel):
     use_cache: Optional[bool] = True
 
 
+# /api/search trusts a positive index existence check for this many seconds
+INDEX_EXISTS_TTL = 60
+_index_exists_checked_at = 0.0
+
+
 # Helper functions
+async def search_index_exists() -> bool:
+    """indices.exists for the search path, skipping the round trip after a recent positive check"""
+    global _index_exists_checked_at
+    if time.monotonic() - _index_exists_checked_at < INDEX_EXISTS_TTL:
+        return True
+
+    client = get_async_opensearch_client()
+    if await client.indices.exists(index=Config.INDEX_NAME):
+        _index_exists_checked_at = time.monotonic()
+        return True
+    return False
+
+
 def ensure_index_exists_with_knn():
     """
     Ensure index exists with proper k-NN vector configuration.
@@ -62,22 +103,18 @@ def ensure_index_exists_with_knn():
     client = get_opensearch_client()
 
     try:
-        # Check if index exists
-        if not client.indices.exists(index=Config.INDEX_NAME):
+        # One round trip answers both "does it exist" and "is it configured right"
+        mapping = client.indices.get_mapping(index=Config.INDEX_NAME, ignore=404)
+        if Config.INDEX_NAME not in mapping:
             print(f"Index '{Config.INDEX_NAME}' does not exist. Creating...")
             result = create_index()
             return True, True, f"Created new index: {result['message']}"
 
         # Index exists - verify it has proper k-NN configuration
-        mapping = client.indices.get_mapping(index=Config.INDEX_NAME)
         properties = mapping[Config.INDEX_NAME]['mappings']['properties']
 
-        # Check critical fields
-        has_vector = 'description_vector' in properties
-        is_knn_vector = properties.get('description_vector', {}).get('type') == 'knn_vector'
-        correct_dimension = properties.get('description_vector', {}).get('dimension') == Config.EMBEDDING_DIMENSION
-
-        if not (has_vector and is_knn_vector and correct_dimension):
+        # Check critical fields (k-NN type, dimension and vector data type)
+        if not is_vector_mapping_current(properties.get('description_vector', {})):
             # Index exists but has wrong schema - need to recreate
             print(f"Index '{Config.INDEX_NAME}' has incorrect schema. Recreating...")
 
@@ -110,61 +147,76 @@ def ensure_index_exists_with_knn():
         return False, False, f"Error checking/creating index: {str(e)}"
 
 
+def dig(data: Optional[Dict], *keys: str) -> Any:
+    """Follow nested keys, returning None as soon as one is missing or null"""
+    for key in keys:
+        if not data:
+            return None
+        data = data.get(key)
+    return data
+
+
 def process_property(client: CoreLogicAPIClient, address: dict) -> Optional[Dict[str, Any]]:
     """Process a single property address"""
     search_results = client.search_property(address)
     if not search_results or not search_results.get("items"):
         return None
 
-    for idx, property_item in enumerate(search_results["items"]):
-        clip = property_item.get("clip")
-        if not clip:
-            continue
+    items = search_results["items"]
 
-        details = client.get_property_details(clip)
+    # Detail lookups are independent; run them concurrently over the pooled session
+    with ThreadPoolExecutor(max_workers=Config.CORELOGIC_CONCURRENCY) as executor:
+        details_list = list(executor.map(
+            lambda item: client.get_property_details(item["clip"]) if item.get("clip") else None,
+            items
+        ))
 
+    for property_item, details in zip(items, details_list):
         if details:
-            property_details = {
-                'allBuildingsSummary': details.get("buildings", {}).get("data", {}).get("allBuildingsSummary"),
-                'ownership': details.get("ownership", {}).get("data"),
-                'siteLocation': details.get("siteLocation", {}).get("data"),
-                'taxAssessment': details.get("taxAssessment", {}).get("items"),
-                'mostRecentOwnerTransfer': details.get("mostRecentOwnerTransfer", {}).get("items"),
-                'lastMarketSale': details.get("lastMarketSale", {}).get("items")
+            property_item["property_details"] = {
+                'allBuildingsSummary': dig(details, "buildings", "data", "allBuildingsSummary"),
+                'ownership': dig(details, "ownership", "data"),
+                'siteLocation': dig(details, "siteLocation", "data"),
+                'taxAssessment': dig(details, "taxAssessment", "items"),
+                'mostRecentOwnerTransfer': dig(details, "mostRecentOwnerTransfer", "items"),
+                'lastMarketSale': dig(details, "lastMarketSale", "items")
             }
-            search_results["items"][idx]["property_details"] = property_details
 
     return search_results
 
 
 # API Endpoints
+# The root payload never changes, so it is serialized once
+_root_body = orjson.dumps({
+    "message": "Property Data API with OpenSearch",
+    "version": "2.1.0",
+    "features": [
+        "Hybrid semantic + keyword search",
+        "Smart query caching (5-minute TTL)",
+        "Auto-index creation and fixing",
+        "Advanced query parsing",
+        "CoreLogic API integration"
+    ],
+    "endpoints": {
+        "POST /api/data-load": "Load property data from CoreLogic (auto-creates index if needed)",
+        "POST /api/search": "Hybrid semantic search with caching",
+        "POST /api/cache/clear": "Clear search cache",
+        "GET /api/cache/stats": "Get cache statistics",
+        "POST /api/index/create": "Create OpenSearch index",
+        "POST /api/index/load-from-file": "Load and index from JSON file (auto-creates index if needed)",
+        "GET /api/index/stats": "Get index statistics",
+        "GET /api/index/list": "List all indexed properties",
+        "DELETE /api/index/delete": "Delete OpenSearch index",
+        "GET /health": "Health check",
+        "GET /docs": "Swagger documentation"
+    }
+})
+
+
 @app.get("/")
-def read_root():
+async def read_root():
     """Root endpoint"""
-    return {
-        "message": "Property Data API with OpenSearch",
-        "version": "2.1.0",
-        "features": [
-            "Hybrid semantic + keyword search",
-            "Smart query caching (5-minute TTL)",
-            "Auto-index creation and fixing",
-            "Advanced query parsing",
-            "CoreLogic API integration"
-        ],
-        "endpoints": {
-            "POST /api/data-load": "Load property data from CoreLogic (auto-creates index if needed)",
-            "POST /api/search": "Hybrid semantic search with caching",
-            "POST /api/cache/clear": "Clear search cache",
-            "GET /api/cache/stats": "Get cache statistics",
-            "POST /api/index/create": "Create OpenSearch index",
-            "POST /api/index/load-from-file": "Load and index from JSON file (auto-creates index if needed)",
-            "GET /api/index/stats": "Get index statistics",
-            "GET /api/index/list": "List all indexed properties",
-            "DELETE /api/index/delete": "Delete OpenSearch index",
-            "GET /health": "Health check",
-            "GET /docs": "Swagger documentation"
-        }
-    }
+    return Response(content=_root_body, media_type="application/json")
 
 
 @app.post("/api/data-load")
@@ -187,26 +239,32 @@ def load_property_data(request: DataLoadRequest):
             print(f"✅ Index check: {message}")
 
         # Authenticate with CoreLogic API
-        client = CoreLogicAPIClient()
-        if not client.authenticate():
+        client = get_corelogic_client()
+        if not client.ensure_token():
             raise HTTPException(status_code=401, detail="Authentication failed")
 
         results = []
         files_saved = []
+        items_to_index = []
         indexed_count = 0
         failed_count = 0
 
-        for addr in request.addresses:
-            address_dict = {
+        address_dicts = [
+            {
                 'street': addr.street,
                 'city': addr.city,
                 'state': addr.state,
                 'zip_code': addr.zip_code,
                 'county': addr.county
             }
+            for addr in request.addresses
+        ]
 
-            result = process_property(client, address_dict)
+        # CoreLogic lookups are I/O bound; process addresses concurrently (results keep request order)
+        with ThreadPoolExecutor(max_workers=Config.CORELOGIC_CONCURRENCY) as executor:
+            processed = list(executor.map(lambda address: process_property(client, address), address_dicts))
 
+        for addr, result in zip(request.addresses, processed):
             if result:
                 results.append(result)
 
@@ -216,13 +274,13 @@ def load_property_data(request: DataLoadRequest):
                     save_to_json(result, filename)
                     files_saved.append(filename)
 
-                # Index in OpenSearch
                 if request.index_in_opensearch:
-                    for item in result.get('items', []):
-                        if index_property(item):
-                            indexed_count += 1
-                        else:
-                            failed_count += 1
+                    items_to_index.extend(result.get('items', []))
+
+        # Index all addresses' properties together, so embedding requests are
+        # batched across addresses rather than per address
+        if items_to_index:
+            indexed_count, failed_count = index_properties_bulk(items_to_index)
 
         return {
             "status": "success",
@@ -237,8 +295,50 @@ def load_property_data(request: DataLoadRequest):
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+# Painless twin of the old description[:200] + '...' listing preview
+DESCRIPTION_PREVIEW_SCRIPT = {
+    "lang": "painless",
+    "source": "def d = params['_source']['description']; "
+              "if (d == null) { return ''; } "
+              "return d.length() > params.limit ? d.substring(0, params.limit) + '...' : d;",
+    "params": {"limit": 200}
+}
+
+
+# Shared default for missing sections; only ever read, never mutated
+_EMPTY: Dict = {}
+
+
+def shape_search_hit(hit: Dict) -> Dict:
+    """Flatten one OpenSearch hit into the property summary returned by /api/search"""
+    source = hit['_source']
+    # Nested sections are looked up once per hit
+    prop_details = source.get('property_details') or _EMPTY
+    summary = prop_details.get('allBuildingsSummary') or _EMPTY
+    tax_assessments = prop_details.get('taxAssessment')
+    assessment = (tax_assessments[0].get('assessedValue') or _EMPTY) if tax_assessments else _EMPTY
+
+    return {
+        'clip': source.get('clip'),
+        'address': source.get('propertyAddress'),
+        'description': source.get('description', ''),
+        'score': hit.get('_score'),
+        'details': {
+            'bedrooms': summary.get('bedroomsCount'),
+            'bathrooms': summary.get('bathroomsCount'),
+            'livingAreaSqFt': summary.get('livingAreaSquareFeet'),
+            'totalAreaSqFt': summary.get('totalAreaSquareFeet')
+        },
+        'assessedValue': {
+            'total': assessment.get('calculatedTotalValue'),
+            'year': assessment.get('taxAssessedYear')
+        }
+    }
+
+
 @app.post("/api/search")
-def search_properties(request: SearchRequest):
+async def search_properties(request: SearchRequest, response: Response,
+                            if_none_match: Optional[str] = Header(None)):
     """
     Hybrid semantic search with caching
 
@@ -247,18 +347,21 @@ def search_properties(request: SearchRequest):
     - Smart query parsing for filters (bedrooms, price, location)
     - 5-minute cache for faster repeated queries
     - Automatic sorting based on query intent
+    - ETag / If-None-Match: unchanged result pages return 304 with no body.
+      This is an API-specific contract for our own clients (HTTP caches don't
+      revalidate POSTs, and RFC 9110 would answer 412 here): resend the ETag
+      of a previous response and reuse that body on 304
     """
     try:
         # Check if index exists before searching
-        client = get_opensearch_client()
-        if not client.indices.exists(index=Config.INDEX_NAME):
+        if not await search_index_exists():
             raise HTTPException(
                 status_code=404,
                 detail=f"Index '{Config.INDEX_NAME}' does not exist. Load some properties first using POST /api/data-load with index_in_opensearch: true"
             )
 
         # Execute hybrid search with caching
-        results = hybrid_search(
+        results = await hybrid_search(
             user_query=request.query,
             page=request.page,
             size=request.size,
@@ -271,40 +374,27 @@ def search_properties(request: SearchRequest):
         # Extract performance metrics
         performance = results.pop('performance', {})
 
-        properties = []
-        for hit in results['hits']['hits']:
-            source = hit['_source']
-            prop_details = source.get('property_details', {})
-
-            # Extract assessed value safely
-            assessed_value = None
-            tax_year = None
-            tax_assessments = prop_details.get('taxAssessment', [])
-            if tax_assessments and len(tax_assessments) > 0:
-                assessment = tax_assessments[0].get('assessedValue', {})
-                assessed_value = assessment.get('calculatedTotalValue')
-                tax_year = assessment.get('taxAssessedYear')
-
-            properties.append({
-                'clip': source.get('clip'),
-                'address': source.get('propertyAddress'),
-                'description': source.get('description', ''),
-                'score': hit.get('_score'),
-                'details': {
-                    'bedrooms': prop_details.get('allBuildingsSummary', {}).get('bedroomsCount'),
-                    'bathrooms': prop_details.get('allBuildingsSummary', {}).get('bathroomsCount'),
-                    'livingAreaSqFt': prop_details.get('allBuildingsSummary', {}).get('livingAreaSquareFeet'),
-                    'totalAreaSqFt': prop_details.get('allBuildingsSummary', {}).get('totalAreaSquareFeet')
-                },
-                'assessedValue': {
-                    'total': assessed_value,
-                    'year': tax_year
-                }
-            })
+        # hits.hits is absent on an empty page (filter_path drops empty arrays)
+        properties = list(map(shape_search_hit, results['hits'].get('hits', [])))
+
+        total = results['hits']['total']['value']
+
+        # Hash the returned page itself, so re-indexed documents with the same
+        # clips (new description, assessed value...) get a new ETag
+        etag = '"' + hashlib.blake2b(orjson.dumps({
+            'q': request.query,
+            'p': request.page,
+            's': request.size,
+            't': total,
+            'properties': properties
+        }), digest_size=8).hexdigest() + '"'
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
 
         return {
             "query": request.query,
-            "total": results['hits']['total']['value'],
+            "total": total,
             "page": request.page,
             "size": request.size,
             "properties": properties,
@@ -318,10 +408,10 @@ def search_properties(request: SearchRequest):
 
 
 @app.post("/api/cache/clear")
-def clear_cache():
+async def clear_cache():
     """Clear search query cache"""
     try:
-        count = clear_search_cache()
+        count = await clear_search_cache()
         return {
             "status": "success",
             "message": f"Cleared {count} cache entries"
@@ -331,10 +421,10 @@ def clear_cache():
 
 
 @app.get("/api/cache/stats")
-def cache_stats():
+async def cache_stats():
     """Get cache statistics"""
     try:
-        stats = get_cache_stats()
+        stats = await get_cache_stats()
         return stats
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -359,16 +449,14 @@ def create_opensearch_index():
 
 
 @app.post("/api/index/load-from-file")
-def load_from_json_file(filepath: str = "property_search_data.json"):
+async def load_from_json_file(filepath: str = "property_search_data.json"):
     """
     Load and index properties from a JSON file
     Automatically ensures index exists with proper k-NN configuration
     """
     try:
-        import json
-
         # Ensure index exists with proper k-NN configuration
-        exists, healthy, message = ensure_index_exists_with_knn()
+        exists, healthy, message = await asyncio.to_thread(ensure_index_exists_with_knn)
         if not exists or not healthy:
             raise HTTPException(
                 status_code=500,
@@ -377,8 +465,8 @@ def load_from_json_file(filepath: str = "property_search_data.json"):
         print(f"✅ Index check: {message}")
 
         # Load JSON file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
 
         # Handle CoreLogic structure
         if isinstance(data, dict) and 'items' in data:
@@ -388,15 +476,8 @@ def load_from_json_file(filepath: str = "property_search_data.json"):
         else:
             properties = [data]
 
-        # Index each property
-        indexed_count = 0
-        failed_count = 0
-
-        for prop in properties:
-            if index_property(prop):
-                indexed_count += 1
-            else:
-                failed_count += 1
+        # Index all properties in bulk (embedding batches run concurrently)
+        indexed_count, failed_count = await index_properties_bulk_async(properties)
 
         return {
             "status": "success",
@@ -413,18 +494,18 @@ def load_from_json_file(filepath: str = "property_search_data.json"):
 
 
 @app.get("/api/index/stats")
-def get_index_stats():
+async def get_index_stats():
     """Get index statistics"""
     try:
-        client = get_opensearch_client()
+        client = get_async_opensearch_client()
 
-        if not client.indices.exists(index=Config.INDEX_NAME):
+        if not await client.indices.exists(index=Config.INDEX_NAME):
             return {
                 "status": "not_found",
                 "message": f"Index '{Config.INDEX_NAME}' does not exist"
             }
 
-        count = client.count(index=Config.INDEX_NAME)
+        count = await client.count(index=Config.INDEX_NAME)
         return {
             "index": Config.INDEX_NAME,
             "document_count": count['count']
@@ -434,35 +515,38 @@ def get_index_stats():
 
 
 @app.get("/api/index/list")
-def list_properties():
+async def list_properties():
     """List all indexed properties"""
     try:
-        client = get_opensearch_client()
+        client = get_async_opensearch_client()
 
-        if not client.indices.exists(index=Config.INDEX_NAME):
+        if not await client.indices.exists(index=Config.INDEX_NAME):
             raise HTTPException(
                 status_code=404,
                 detail=f"Index '{Config.INDEX_NAME}' does not exist"
             )
 
-        # Get all properties
+        # Get all properties; descriptions are cut to a preview on the
+        # OpenSearch side so the full text never crosses the wire
         query = {
             "size": 100,
             "query": {"match_all": {}},
-            "_source": ["clip", "propertyAddress", "description"]
+            "_source": ["clip", "propertyAddress"],
+            "script_fields": {
+                "description_preview": {"script": DESCRIPTION_PREVIEW_SCRIPT}
+            }
         }
 
-        results = client.search(index=Config.INDEX_NAME, body=query)
+        results = await client.search(index=Config.INDEX_NAME, body=query)
 
-        properties = []
-        for hit in results['hits']['hits']:
-            source = hit['_source']
-            properties.append({
-                'clip': source.get('clip'),
-                'address': source.get('propertyAddress', {}),
-                'description': source.get('description', '')[:200] + '...' if len(
-                    source.get('description', '')) > 200 else source.get('description', '')
-            })
+        properties = [
+            {
+                'clip': hit['_source'].get('clip'),
+                'address': hit['_source'].get('propertyAddress', {}),
+                'description': hit.get('fields', {}).get('description_preview', [''])[0]
+            }
+            for hit in results['hits']['hits']
+        ]
 
         return {
             "total": results['hits']['total']['value'],
@@ -477,6 +561,7 @@ def list_properties():
 @app.delete("/api/index/delete")
 def delete_opensearch_index():
     """Delete OpenSearch index"""
+    global _index_exists_checked_at
     try:
         client = get_opensearch_client()
 
@@ -487,6 +572,7 @@ def delete_opensearch_index():
             }
 
         client.indices.delete(index=Config.INDEX_NAME)
+        _index_exists_checked_at = 0.0
 
         return {
             "status": "deleted",
@@ -497,11 +583,11 @@ def delete_opensearch_index():
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint"""
     try:
-        client = get_opensearch_client()
-        client.cluster.health()
+        client = get_async_opensearch_client()
+        await client.cluster.health()
         opensearch_status = "connected"
 
         # Check index health if it exists
@@ -509,12 +595,13 @@ def health_check():
         doc_count = 0
         is_knn_enabled = False
 
-        if client.indices.exists(index=Config.INDEX_NAME):
-            count = client.count(index=Config.INDEX_NAME)
+        # A missing index comes back as a 404 body instead of a separate exists check
+        mapping = await client.indices.get_mapping(index=Config.INDEX_NAME, ignore=404)
+        if Config.INDEX_NAME in mapping:
+            count = await client.count(index=Config.INDEX_NAME)
             doc_count = count['count']
 
             # Check k-NN configuration
-            mapping = client.indices.get_mapping(index=Config.INDEX_NAME)
             properties = mapping[Config.INDEX_NAME]['mappings']['properties']
             is_knn_enabled = properties.get('description_vector', {}).get('type') == 'knn_vector'
 
@@ -529,11 +616,16 @@ def health_check():
         doc_count = 0
         is_knn_enabled = False
 
-    # Get cache stats
-    cache_info = get_cache_stats()
+    # Get cache stats (count only; no per-entry sample)
+    try:
+        cache_info = await get_cache_stats(sample=0)
+        cache_status = "connected" if cache_info['available'] else "unavailable"
+    except Exception:
+        cache_info = {'backend': 'unknown', 'total_entries': 0, 'ttl_seconds': Config.CACHE_QUERY_RESULTS_TTL}
+        cache_status = "unavailable"
 
     return {
-        "status": "healthy" if opensearch_status == "connected" else "unhealthy",
+        "status": "healthy" if opensearch_status == "connected" and cache_status == "connected" else "unhealthy",
         "opensearch": opensearch_status,
         "index": {
             "name": Config.INDEX_NAME,
@@ -542,12 +634,39 @@ def health_check():
             "knn_enabled": is_knn_enabled
         },
         "cache": {
+            "status": cache_status,
+            "backend": cache_info['backend'],
             "entries": cache_info['total_entries'],
             "ttl_seconds": cache_info['ttl_seconds']
         }
     }
 
 
+# API documentation
+_openapi_spec: Optional[bytes] = None
+
+
+@app.get("/openapi.json", include_in_schema=False)
+def openapi_spec():
+    """OpenAPI spec, serialized once and reused for every request"""
+    global _openapi_spec
+    if _openapi_spec is None:
+        _openapi_spec = orjson.dumps(app.openapi())
+    return Response(content=_openapi_spec, media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+def swagger_docs():
+    """Swagger UI"""
+    return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{app.title} - Swagger UI")
+
+
+@app.get("/redoc", include_in_schema=False)
+def redoc_docs():
+    """ReDoc"""
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
+
+
 @app.on_event("startup")
 async def startup_event():
     """Display startup information"""
@@ -577,6 +696,26 @@ async def startup_event():
     print('  • "property with 2+ acres in HI"')
     print("\n" + "=" * 70 + "\n")
 
+    # Connect to the cache now rather than on the first search request
+    await get_cache_service()
+
+    app.state.background_warmup = asyncio.create_task(run_background_warmup())
+
+
+async def run_background_warmup():
+    """Load the embedding model, then keep the popular queries cached"""
+    await warm_up_embedding_model()
+    if Config.CACHE_WARMING_ENABLED:
+        await cache_warmer_loop()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks and release shared client connections"""
+    app.state.background_warmup.cancel()
+    await close_async_opensearch_client()
+    await close_cache_service()
+
 
 if __name__ == "__main__":
     import uvicorn